@@ -1,4 +1,5 @@
-import asyncio
+from typing import Optional
+
 import aiohttp
 
 from PySide6.QtCore import QObject, Signal
@@ -11,12 +12,13 @@ LOGIN_URL = CONFIG.dmh.login_url
 POST_URL = CONFIG.dmh.post_url
 BACKUP_PATH = CONFIG.paths.backup_path
 CONCURRENCY = CONFIG.dmh.concurrent_limit
+KEEPALIVE_TIMEOUT = 60
 
 
 class DMH(QObject):
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         super().__init__()
-        self.session = self.create_session()
+        self._session = session
         self.infoBarSignal = signalBus.infoBarSignal
 
     def _send_task_finish_signal(self, output: dict):
@@ -25,13 +27,22 @@ class DMH(QObject):
         elif output['status'] == 'fail':
             self.infoBarSignal.emit('WARNING', f"{output['message']}", f"{output['result']}")
 
-    def create_session(self):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._create_session())
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, created on first use inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
 
     @staticmethod
-    async def _create_session():
-        return aiohttp.ClientSession()
+    def _create_session() -> aiohttp.ClientSession:
+        # One pooled, keep-alive connector so a batch of submissions reuses its connections
+        connector = aiohttp.TCPConnector(limit=CONCURRENCY, keepalive_timeout=KEEPALIVE_TIMEOUT)
+        return aiohttp.ClientSession(connector=connector)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     async def login(self, username: str, passcode: str) -> None:
         data = {"username":username, "PASSWORD": passcode}
@@ -1,16 +1,23 @@
 # src/dmh_mr_tool/business/services/parser_service.py
 """Service for parsing PDF and Excel files with various templates"""
 
+import os
 import re
 import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-import pdfplumber  # PyMuPDF
-import pandas as pd
-import openpyxl
+
+from sqlalchemy import select
 
 from database.connection import DatabaseManager
+from parsers.pdf_parser import extract_pdf_text
 from database.models import ParseTemplateMR, ParseTemplateNZ, ColumnMap
 from config.settings import CONFIG
 from ui.utils.signal_bus import signalBus
@@ -20,12 +27,234 @@ import structlog
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a template regex once; re's own cache is small and shared with everything else"""
+    return re.compile(pattern, re.MULTILINE | re.DOTALL)
+
+
+# Template table columns that describe the template rather than hold a field pattern
+TEMPLATE_META_COLUMNS = frozenset({'id', 'template_name', 'is_valid', 'update_timestamp'})
+
+# File types the parser can read
+EXCEL_EXTENSIONS = frozenset({'.xlsx', '.xls'})
+SUPPORTED_EXTENSIONS = EXCEL_EXTENSIONS | {'.pdf'}
+
+
+def is_supported_file(file_path: str) -> bool:
+    """Whether the parser can read a file, judged by its extension"""
+    return os.path.splitext(file_path)[1].lower() in SUPPORTED_EXTENSIONS
+
+
+def list_supported_files(folder_path: str) -> Optional[List[Path]]:
+    """
+    Supported files directly inside a folder, from a single directory scan
+
+    Opening the scan doubles as the existence check: None means the folder
+    does not exist or is not a directory.
+    """
+    try:
+        entries = os.scandir(folder_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    with entries:
+        return [
+            Path(entry.path) for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS and entry.is_file()
+        ]
+
+
+def regex_patterns(template_data: Dict[str, Any]) -> Dict[str, str]:
+    """Template fields that hold a regex, skipping empty and formula ('=...') patterns"""
+    return {
+        field_name: pattern for field_name, pattern in template_data.items()
+        if isinstance(pattern, str) and pattern and not pattern.startswith('=')
+    }
+
+
+def match_value(match) -> str:
+    """Value a template pattern captured: its first group when it has one, else the whole match"""
+    return match.group(1 if match.re.groups else 0).strip()
+
+
+def search_patterns(patterns: Dict[str, str], text: str) -> Dict[str, str]:
+    """
+    First match of each field's pattern in text
+
+    Each pattern is searched on its own with its cached compiled form, so a
+    field's value never depends on the other fields' matches. Invalid patterns
+    are logged and skipped.
+
+    Returns:
+        Dictionary with field_name -> stripped value, in the order of patterns
+    """
+    values = {}
+    for field_name, pattern in patterns.items():
+        try:
+            match = compile_pattern(pattern).search(text)
+        except re.error as e:
+            logger.warning("Invalid regex pattern", field=field_name, error=str(e))
+            continue
+        if match:
+            values[field_name] = match_value(match)
+
+    return values
+
+
+class TextCache:
+    """
+    Persistent cache of extracted PDF text, keyed by path, size and modification time
+
+    Text is stored in a small SQLite file under the temp directory so reopening
+    an unchanged document skips extraction, across sessions as well. The most
+    recently used texts are also kept in memory, so re-parsing a document in the
+    same session skips the database too. Each call opens its own connection, so
+    the cache can be used from worker threads.
+    """
+
+    MEMORY_SIZE = 32
+
+    def __init__(self, db_path: Path, extract):
+        self.db_path = db_path
+        self._extract = extract
+        self._memory: OrderedDict = OrderedDict()  # key -> text, least recently used first
+        self._memory_lock = threading.Lock()
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS pdf_text (key TEXT PRIMARY KEY, text TEXT NOT NULL)")
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        stat = file_path.stat()
+        return f"{file_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def get_text(self, file_path) -> str:
+        """Text of a PDF, extracted and stored on first request"""
+        file_path = Path(file_path)
+        key = self._key(file_path)
+        with self._memory_lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                return text
+
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+            row = conn.execute("SELECT text FROM pdf_text WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                text = row[0]
+            else:
+                text = self._extract(file_path)
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO pdf_text (key, text) VALUES (?, ?)", (key, text))
+
+        self._remember(key, text)
+        return text
+
+    def _remember(self, key: str, text: str):
+        with self._memory_lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.MEMORY_SIZE:
+                self._memory.popitem(last=False)
+
+    def missing(self, file_paths) -> List[Path]:
+        """Files among file_paths whose current text is not cached; unreadable files are left out"""
+        result = []
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+            for file_path in map(Path, file_paths):
+                try:
+                    key = self._key(file_path)
+                except OSError:
+                    continue
+                if conn.execute("SELECT 1 FROM pdf_text WHERE key = ?", (key,)).fetchone() is None:
+                    result.append(file_path)
+        return result
+
+    def put_many(self, items: List[Tuple[Path, str]]):
+        """Store extracted text for several files in one transaction"""
+        rows = []
+        for file_path, text in items:
+            try:
+                rows.append((self._key(file_path), text))
+            except OSError:
+                continue  # removed since it was extracted
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO pdf_text (key, text) VALUES (?, ?)", rows)
+
+    async def warm_many(self, file_paths):
+        """
+        Extract the text of several PDFs in parallel worker processes ahead of parsing them
+
+        Extraction is CPU-bound, so processes rather than threads give a real speedup.
+        Files that fail here are left uncached; parsing them reports the error.
+        """
+        missing = await asyncio.to_thread(self.missing, file_paths)
+        if not missing:
+            return
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(len(missing), os.cpu_count() or 1)) as pool:
+            texts = await asyncio.gather(
+                *(loop.run_in_executor(pool, self._extract, file_path) for file_path in missing),
+                return_exceptions=True
+            )
+
+        extracted = [(file_path, text) for file_path, text in zip(missing, texts) if isinstance(text, str)]
+        if extracted:
+            await asyncio.to_thread(self.put_many, extracted)
+
+    async def warm(self, file_path):
+        """Extract and store a PDF's text in the background ahead of parsing"""
+        try:
+            await asyncio.to_thread(self.get_text, file_path)
+        except Exception as e:
+            logger.warning(f"Failed to warm text cache for {file_path}: {e}")
+
+
+def _apply_asx_mit_notice_rules(results: Dict, column_map: Dict) -> None:
+    """Default the tax rate per client specific"""
+    if 'tax_rate' not in results or results['tax_rate']['value'] is None:
+        results['tax_rate'] = {
+            'value': 0.3,
+            'comment': 'Default value per client specific',
+            'd_desc': column_map.get('tax_rate', {}).get('d_desc', 'Tax Rate')
+        }
+
+
+def _apply_vanguard_au_rules(results: Dict, column_map: Dict) -> None:
+    """Calculate the total distribution from its components"""
+    total = 0
+    for field in ['DOM_INC', 'FOR_INC', 'DOM_DID']:
+        if field in results and results[field]['value']:
+            try:
+                total += float(results[field]['value'])
+            except (ValueError, TypeError):
+                pass
+
+    if total > 0:
+        results['TOTAL'] = {
+            'value': total,
+            'comment': 'Sum of DOM_INC + FOR_INC + DOM_DID',
+            'd_desc': 'Total Distribution'
+        }
+
+
+# Business rules per template, applied in place; templates without an entry (e.g. the
+# batch-only 'Hi-Trust UR') have no calculated fields
+BUSINESS_RULES = {
+    'asx_mit_notice': _apply_asx_mit_notice_rules,
+    'vanguard_au': _apply_vanguard_au_rules,
+}
+
+
 class ParserService:
     """Service for parsing financial documents"""
 
     _instance = None
     _db_manager = None
 
+    # Files parsed at once by batch_parse_folder
+    BATCH_CONCURRENCY = min(8, os.cpu_count() or 4)
+
     def __new__(cls):
         """Singleton pattern for service"""
         if cls._instance is None:
@@ -37,8 +266,9 @@ class ParserService:
         """Initialize service with database manager"""
         if not self._initialized:
             self._ensure_db_manager()
-            self.templates_cache = {}
+            self.templates_cache = {}  # template_name -> {field_name: pattern}
             self.column_map_cache = {}
+            self.text_cache = TextCache(CONFIG.paths.temp_path / "pdf_text_cache.db", self.extract_pdf_text)
             self._load_column_mappings()
             self._initialized = True
 
@@ -104,42 +334,63 @@ class ParserService:
         return [mapping['d_desc'] for mapping in self.column_map_cache.values()]
 
     def get_template_data(self, template_name: str) -> Dict[str, str]:
-        """Get template patterns for a specific template"""
-        template_data = {}
+        """
+        Get template patterns for a specific template
+
+        Templates are read from the database and compiled once, then served
+        from templates_cache until clear_template_cache is called. The parser
+        view and batch_parse_folder clear it at the start of each parse and
+        batch, so a template edited in the database applies to the next run
+        without a restart.
+        """
+        template_data = self.templates_cache.get(template_name)
+        if template_data is None:
+            template_data = self._load_template_data(template_name)
+            for pattern in regex_patterns(template_data).values():
+                try:
+                    compile_pattern(pattern)
+                except re.error:
+                    pass  # reported when the pattern is applied
+            self.templates_cache[template_name] = template_data
+        return template_data
 
+    def clear_template_cache(self):
+        """Forget loaded templates so the next parse reads them from the database again"""
+        self.templates_cache.clear()
+
+    def _load_template_data(self, template_name: str) -> Dict[str, str]:
+        """Read template patterns for a specific template from the database"""
         with self.db_manager.session() as session:
-            # Try MR template first
-            mr_template = session.query(ParseTemplateMR).filter(
-                ParseTemplateMR.template_name == template_name,
-                ParseTemplateMR.is_valid == True
-            ).first()
-
-            if mr_template:
-                # Get all column attributes
-                for column in ParseTemplateMR.__table__.columns:
-                    if column.name not in ['id', 'template_name', 'is_valid', 'update_timestamp']:
-                        value = getattr(mr_template, column.name)
-                        if value:
-                            template_data[column.name] = value
-            else:
-                # Try NZ template
-                nz_template = session.query(ParseTemplateNZ).filter(
-                    ParseTemplateNZ.template_name == template_name,
-                    ParseTemplateNZ.is_valid == True
-                ).first()
-
-                if nz_template:
-                    for column in ParseTemplateNZ.__table__.columns:
-                        if column.name not in ['id', 'template_name', 'is_valid', 'update_timestamp']:
-                            value = getattr(nz_template, column.name)
-                            if value:
-                                template_data[column.name] = value
+            # Try MR template first, then NZ; rows come back as plain column mappings
+            for model in (ParseTemplateMR, ParseTemplateNZ):
+                table = model.__table__
+                row = session.execute(
+                    select(table).where(
+                        table.c.template_name == template_name,
+                        table.c.is_valid == True
+                    ).limit(1)
+                ).mappings().first()
+
+                if row is not None:
+                    return {
+                        name: value for name, value in row.items()
+                        if value and name not in TEMPLATE_META_COLUMNS
+                    }
 
-        return template_data
+        return {}
 
     async def parse_file(self, file_path: str, template_name: str) -> Dict[str, Dict[str, Any]]:
         """
-        Parse a file using the specified template
+        Parse a file using the specified template, off the event loop thread
+
+        Returns:
+            Dictionary with field_name -> {value, comment, d_desc}
+        """
+        return await asyncio.to_thread(self.parse_file_sync, file_path, template_name)
+
+    def parse_file_sync(self, file_path: str, template_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a file using the specified template in the calling thread
 
         Returns:
             Dictionary with field_name -> {value, comment, d_desc}
@@ -153,53 +404,41 @@ class ParserService:
         template_data = self.get_template_data(template_name)
 
         # Parse based on file type
-        if file_path.suffix.lower() == '.pdf':
-            return await self._parse_pdf(file_path, template_data, template_name)
-        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-            return await self._parse_excel(file_path, template_data, template_name)
+        suffix = file_path.suffix.lower()
+        if suffix == '.pdf':
+            return self._parse_pdf(file_path, template_data, template_name)
+        elif suffix in EXCEL_EXTENSIONS:
+            return self._parse_excel(file_path, template_data, template_name)
         else:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
 
-    async def _parse_pdf(self, file_path: Path, template_data: Dict, template_name: str) -> Dict[str, Dict[str, Any]]:
+    # Module-level function, so worker processes can run it without importing the service
+    extract_pdf_text = staticmethod(extract_pdf_text)
+
+    def _parse_pdf(self, file_path: Path, template_data: Dict, template_name: str) -> Dict[str, Dict[str, Any]]:
         """Parse PDF file"""
         results = {}
 
         try:
-            full_text = ""
-            with pdfplumber.open(str(file_path)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
+            full_text = self.text_cache.get_text(file_path)
 
             # Apply regex patterns from template
-            for field_name, pattern in template_data.items():
-                if pattern and not pattern.startswith('='):  # Skip formula patterns
+            for field_name, value in search_patterns(regex_patterns(template_data), full_text).items():
+                # Try to convert to appropriate type
+                if field_name in ['income_rate', 'tax_rate', 'franked_pct', 'unfranked_pct']:
                     try:
-                        match = re.search(pattern, full_text, re.MULTILINE | re.DOTALL)
-                        if match:
-                            value = match.group(1) if match.groups() else match.group(0)
-
-                            # Clean the value
-                            value = value.strip()
-
-                            # Try to convert to appropriate type
-                            if field_name in ['income_rate', 'tax_rate', 'franked_pct', 'unfranked_pct']:
-                                try:
-                                    value = float(value)
-                                except ValueError:
-                                    pass
-                            elif field_name in ['ex_date', 'pay_date', 'pub_date']:
-                                # Try to parse date
-                                value = self._parse_date(value)
-
-                            results[field_name] = {
-                                'value': value,
-                                'comment': '',
-                                'd_desc': self.column_map_cache.get(field_name, {}).get('d_desc', field_name)
-                            }
-                    except re.error as e:
-                        logger.warning(f"Invalid regex pattern for {field_name}: {e}")
+                        value = float(value)
+                    except ValueError:
+                        pass
+                elif field_name in ['ex_date', 'pay_date', 'pub_date']:
+                    # Try to parse date
+                    value = self._parse_date(value)
+
+                results[field_name] = {
+                    'value': value,
+                    'comment': '',
+                    'd_desc': self.column_map_cache.get(field_name, {}).get('d_desc', field_name)
+                }
 
             # Apply business rules for calculated fields
             results = self._apply_business_rules(results, template_name)
@@ -219,8 +458,10 @@ class ParserService:
 
         return results
 
-    async def _parse_excel(self, file_path: Path, template_data: Dict, template_name: str) -> Dict[str, Dict[str, Any]]:
+    def _parse_excel(self, file_path: Path, template_data: Dict, template_name: str) -> Dict[str, Dict[str, Any]]:
         """Parse Excel file"""
+        import pandas as pd  # heavy import, deferred until an Excel file is parsed
+
         results = {}
 
         try:
@@ -272,39 +513,9 @@ class ParserService:
 
     def _apply_business_rules(self, results: Dict, template_name: str) -> Dict:
         """Apply business rules for calculated fields"""
-
-        # Example business rules based on template
-        if template_name == 'asx_mit_notice':
-            # Tax rate default
-            if 'tax_rate' not in results or results['tax_rate']['value'] is None:
-                results['tax_rate'] = {
-                    'value': 0.3,
-                    'comment': 'Default value per client specific',
-                    'd_desc': self.column_map_cache.get('tax_rate', {}).get('d_desc', 'Tax Rate')
-                }
-
-        elif template_name == 'vanguard_au':
-            # Calculate total from components
-            total = 0
-            for field in ['DOM_INC', 'FOR_INC', 'DOM_DID']:
-                if field in results and results[field]['value']:
-                    try:
-                        total += float(results[field]['value'])
-                    except (ValueError, TypeError):
-                        pass
-
-            if total > 0:
-                results['TOTAL'] = {
-                    'value': total,
-                    'comment': 'Sum of DOM_INC + FOR_INC + DOM_DID',
-                    'd_desc': 'Total Distribution'
-                }
-
-        elif template_name == 'Hi-Trust UR':
-            # Special handling for Hi-Trust UR template
-            # This template is for batch processing actual values
-            pass
-
+        rule = BUSINESS_RULES.get(template_name)
+        if rule is not None:
+            rule(results, self.column_map_cache)
         return results
 
     def _parse_date(self, date_str: str) -> datetime.date:
@@ -338,40 +549,47 @@ class ParserService:
         Returns:
             List of parsed results
         """
-        folder = Path(folder_path)
-        if not folder.exists() or not folder.is_dir():
+        # Get all supported files; listing also checks the folder exists
+        files = await asyncio.to_thread(list_supported_files, folder_path)
+        if files is None:
             raise ValueError(f"Invalid folder path: {folder_path}")
 
-        results = []
+        # Read the template afresh once per batch, so edits saved since the last run apply
+        self.clear_template_cache()
 
-        # Get all supported files
-        files = []
-        for ext in ['*.pdf', '*.xlsx', '*.xls']:
-            files.extend(folder.glob(ext))
+        # Extract PDF text across worker processes first; each parse below then reads it from the cache
+        await self.text_cache.warm_many([file_path for file_path in files if file_path.suffix.lower() == '.pdf'])
 
         total = len(files)
-        for i, file_path in enumerate(files):
-            try:
-                # Emit progress signal
-                if hasattr(signalBus, 'spiderProgressSignal'):
-                    signalBus.spiderProgressSignal.emit('Batch Parse', i + 1, total)
-
-                # Parse file
-                parsed = await self.parse_file(str(file_path), template_name)
-
-                results.append({
-                    'file': str(file_path),
-                    'data': parsed,
-                    'success': True
-                })
-
-            except Exception as e:
-                logger.error(f"Failed to parse {file_path}: {e}")
-                results.append({
-                    'file': str(file_path),
-                    'error': str(e),
-                    'success': False
-                })
+        done = 0
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def parse_one(file_path: Path) -> Dict:
+            nonlocal done
+            async with semaphore:
+                try:
+                    parsed = await self.parse_file(str(file_path), template_name)
+                    result = {
+                        'file': str(file_path),
+                        'data': parsed,
+                        'success': True
+                    }
+                except Exception as e:
+                    logger.error("Failed to parse batch file", path=str(file_path), error=str(e))
+                    result = {
+                        'file': str(file_path),
+                        'error': str(e),
+                        'success': False
+                    }
+
+            # Emit progress signal
+            done += 1
+            if hasattr(signalBus, 'spiderProgressSignal'):
+                signalBus.spiderProgressSignal.emit('Batch Parse', done, total)
+            return result
+
+        # Overlap file reads and parses, keeping results in folder order
+        results = list(await asyncio.gather(*(parse_one(file_path) for file_path in files)))
 
         # Emit completion signal
         if hasattr(signalBus, 'parserCompleteSignal'):
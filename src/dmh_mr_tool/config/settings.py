@@ -175,6 +175,10 @@ class AppConfig:
         )
 
 
+# Environment variable naming the config file, checked before config/config_path.ini
+CONFIG_PATH_ENV = "DMH_MR_TOOL_CONFIG"
+
+
 class ConfigManager:
     """Configuration manager singleton"""
     _instance: Optional["ConfigManager"] = None
@@ -187,6 +191,9 @@ class ConfigManager:
 
     def load(self, config_path: Optional[Path] = None) -> AppConfig:
         """Load configuration from file or environment"""
+        if config_path is None and os.environ.get(CONFIG_PATH_ENV):
+            config_path = Path(os.environ[CONFIG_PATH_ENV])
+
         if config_path is None:
             # Try to load from config_path.ini
             config_path_ini = Path("config/config_path.ini")
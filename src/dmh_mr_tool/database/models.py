@@ -7,7 +7,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Boolean, Column, Date, DateTime, Float, ForeignKey,
-    Index, Integer, String, Text, UniqueConstraint, create_engine
+    Index, Integer, String, Text, UniqueConstraint, create_engine, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, Session
@@ -200,6 +200,8 @@ class ParseTemplateMR(Base):
 
     __table_args__ = (
         Index('idx_parse_template_mr_name', 'template_name'),
+        # Template lookups only ever read valid rows
+        Index('idx_parse_template_mr_valid_name', 'template_name', sqlite_where=text('is_valid = 1')),
     )
 
     def __repr__(self):
@@ -228,6 +230,8 @@ class ParseTemplateNZ(Base):
 
     __table_args__ = (
         Index('idx_parse_template_nz_name', 'template_name'),
+        # Template lookups only ever read valid rows
+        Index('idx_parse_template_nz_valid_name', 'template_name', sqlite_where=text('is_valid = 1')),
     )
 
     def __repr__(self):
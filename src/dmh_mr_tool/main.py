@@ -1,11 +1,16 @@
 # src/dmh_mr_tool/main.py
 
+import multiprocessing
+
 # from core.logging import setup_logging
 # from config.settings import CONFIG
-from ui.main_window import run
 
 
 def main():
+    # Imported here rather than at module level: worker processes started with spawn
+    # (PDF text extraction) re-import this module and must not load the UI
+    from ui.main_window import run
+
     # setup_logging(
     #     level=CONFIG.logging.level,
     #     log_file=CONFIG.paths.log_path
@@ -13,4 +18,6 @@ def main():
     run()
 
 if __name__ == "__main__":
+    # Lets a frozen Windows build start its worker processes
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
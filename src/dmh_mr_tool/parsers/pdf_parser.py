@@ -0,0 +1,30 @@
+# src/dmh_mr_tool/parsers/pdf_parser.py
+"""PDF text extraction; kept free of application imports so worker processes load it cheaply"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _get_fitz():
+    """PyMuPDF, imported on first use; much faster text extraction when installed"""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
+
+def extract_pdf_text(file_path) -> str:
+    """Extract the text of all pages of a PDF, one page per line block"""
+    # PDF libraries are heavy to import, so they load with the first document
+    fitz = _get_fitz()
+    if fitz is not None:
+        with fitz.open(str(file_path)) as doc:
+            page_texts = [page.get_text("text").rstrip("\n") for page in doc]
+    else:
+        import pdfplumber
+        with pdfplumber.open(str(file_path)) as pdf:
+            page_texts = [page.extract_text() for page in pdf.pages]
+
+    # Joined once rather than grown page by page
+    return "".join(f"{page_text}\n" for page_text in page_texts if page_text)
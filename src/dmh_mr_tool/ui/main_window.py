@@ -138,6 +138,8 @@ def run():
     window.show()
     with loop:
         loop.run_forever()
+        # The loop has stopped by now, so finish closing the shared HTTP session before it is closed too
+        loop.run_until_complete(window.dmh.close())
 
 if __name__ == "__main__":
     run()
@@ -42,8 +42,8 @@ class SignalBus(QObject):
     """
     mrUpdateSignal
     Signal for MR update operations
-        :action : str - Action type ("add", "update", "delete")
-        :data : dict - Data payload
+        :action : str - Action type ("add", "add_many", "update", "delete")
+        :data : dict - Data payload; for "add_many", {"records": [payload, ...]}
     """
     mrUpdateSignal = Signal(str, dict)
 
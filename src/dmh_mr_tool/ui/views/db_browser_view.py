@@ -3,6 +3,10 @@
 
 import re
 import os
+import csv
+import time
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -11,8 +15,9 @@ from PySide6.QtSql import QSqlQueryModel, QSqlDatabase, QSqlQuery
 from PySide6.QtWidgets import (
     QSplitter, QHeaderView, QVBoxLayout, QHBoxLayout, QWidget,
     QTableView, QAbstractItemView, QFileDialog, QMessageBox,
-    QApplication
+    QApplication, QMenu
 )
+from PySide6.QtGui import QAction
 from qfluentwidgets import (
     TextEdit, PrimaryPushButton, PushButton, ComboBox,
     StrongBodyLabel, BodyLabel, CaptionLabel, CardWidget,
@@ -29,6 +34,8 @@ import structlog
 
 logger = structlog.get_logger()
 
+EXPORT_BUFFER_SIZE = 256 * 1024  # bytes; fewer write syscalls for large exports
+
 
 class SortableSqlModel(QSqlQueryModel):
     """Enhanced SQL model with sorting capability"""
@@ -123,6 +130,7 @@ class DBBrowserInterface(BaseInterface):
         )
         self.setObjectName('dbBrowserInterface')
         self.current_database = None
+        self._confirmWriteBox = None  # created on first write query, then reused
         self.initUI()
         self.initDatabase()
         self.loadQueryTemplates()
@@ -439,14 +447,13 @@ class DBBrowserInterface(BaseInterface):
 
         try:
             # Record start time
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Execute query
             self.model.setBaseQuery(query_text)
 
             # Calculate execution time
-            execution_time = int((time.time() - start_time) * 1000)
+            execution_time = int((time.perf_counter() - start_time) * 1000)
 
             # Check for errors
             if self.model.lastError().isValid():
@@ -494,13 +501,16 @@ class DBBrowserInterface(BaseInterface):
 
     def confirmWriteOperation(self, query: str) -> bool:
         """Show confirmation dialog for write operations"""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Confirm Write Operation")
-        msg_box.setText("You are about to execute a write operation that will modify the database.")
+        msg_box = self._confirmWriteBox
+        if msg_box is None:
+            msg_box = self._confirmWriteBox = QMessageBox(self)
+            msg_box.setWindowTitle("Confirm Write Operation")
+            msg_box.setText("You are about to execute a write operation that will modify the database.")
+            msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            msg_box.setIcon(QMessageBox.Icon.Warning)
+
         msg_box.setInformativeText(f"Query: {query[:100]}{'...' if len(query) > 100 else ''}")
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         msg_box.setDefaultButton(QMessageBox.StandardButton.No)
-        msg_box.setIcon(QMessageBox.Icon.Warning)
 
         return msg_box.exec() == QMessageBox.StandardButton.Yes
 
@@ -533,9 +543,6 @@ class DBBrowserInterface(BaseInterface):
 
     def showTableContextMenu(self, pos):
         """Show context menu for table"""
-        from PySide6.QtWidgets import QMenu
-        from PySide6.QtGui import QAction
-
         menu = QMenu(self)
 
         copy_action = QAction("Copy Selected", self)
@@ -603,10 +610,11 @@ class DBBrowserInterface(BaseInterface):
             return
 
         # Get save file path
+        default_name = f"query_results_{time.strftime('%Y%m%d_%H%M%S')}.csv"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Query Results",
-            "",
+            default_name,
             "CSV Files (*.csv);;All Files (*)"
         )
 
@@ -614,28 +622,22 @@ class DBBrowserInterface(BaseInterface):
             return
 
         try:
-            import csv
-
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            # Re-run the displayed query (including any sort) on a read-only sqlite3 connection:
+            # the Qt model only holds the rows fetched so far, and reading it cell by cell is slow
+            sql = self.model.query().lastQuery()
+            db_uri = Path(self.db.databaseName()).resolve().as_uri() + "?mode=ro"
+            with closing(sqlite3.connect(db_uri, uri=True)) as conn:
+                cursor = conn.execute(sql)
+                headers = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csvfile:
                 writer = csv.writer(csvfile)
-
-                # Write headers
-                headers = []
-                for col in range(self.model.columnCount()):
-                    headers.append(
-                        str(self.model.headerData(col, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole) or ''))
                 writer.writerow(headers)
-
-                # Write data
-                for row in range(self.model.rowCount()):
-                    row_data = []
-                    for col in range(self.model.columnCount()):
-                        item = self.model.index(row, col)
-                        row_data.append(str(self.model.data(item) or ''))
-                    writer.writerow(row_data)
+                writer.writerows(rows)
 
             createSuccessInfoBar(self, "Export Complete",
-                                 f"Exported {self.model.rowCount()} rows to {Path(file_path).name}")
+                                 f"Exported {len(rows)} rows to {Path(file_path).name}")
             logger.info(f"Query results exported to {file_path}")
 
         except Exception as e:
@@ -2,19 +2,30 @@
 """MR Update Interface for managing and submitting parsed business records to DMH"""
 
 import os
+import re
+import sys
+import io
+import csv
+import itertools
+import operator
 import json
+import asyncio
+import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from datetime import datetime, date
+from datetime import date
 from dataclasses import dataclass
+from functools import lru_cache
 
-from PySide6.QtCore import Qt, Signal, QModelIndex
+from PySide6.QtCore import Qt, Signal, QModelIndex, QTimer, QEvent, QRect
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QPushButton, QCheckBox, QMenu, QDialog, QTextEdit,
-    QDialogButtonBox, QFormLayout, QLabel, QProgressBar
+    QHeaderView, QCheckBox, QMenu, QDialog, QTextEdit,
+    QDialogButtonBox, QFormLayout, QLabel, QProgressBar,
+    QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
 )
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QColor, QBrush
 from qfluentwidgets import (
     CardWidget, StrongBodyLabel, BodyLabel, CaptionLabel,
     PrimaryPushButton, PushButton, InfoBar, InfoBarPosition,
@@ -33,6 +44,74 @@ import structlog
 
 logger = structlog.get_logger()
 
+BACKUP_ROOT = CONFIG.paths.backup_path
+
+# Pre-compiled validators for pasted bulk data
+_DATE_RE = re.compile(r'^(\d{4})(\d{2})(\d{2})$')
+_NUM_RE = re.compile(r'^[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$')
+
+# Column order of pasted bulk data
+_BULK_FIELDS = ('client_id', 'asx_code', 'fund', 'asset_id', 'ex_date', 'pay_date', 'mr_income_rate', 'type')
+
+# Defaults for MRRecord fields missing from a parser result header (dates default to the batch date)
+_RECORD_DEFAULTS = {
+    'client_id': '', 'asx_code': '', 'fund': '', 'asset_id': '',
+    'mr_income_rate': 0.0, 'type': 'Other'
+}
+
+
+def _parse_yyyymmdd(value: str) -> date:
+    """Parse a YYYYMMDD string without going through datetime.strptime"""
+    m = _DATE_RE.match(value)
+    if not m:
+        raise ValueError(f"Invalid date: {value}")
+    # date() performs the month/day range checks, including leap years
+    return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+
+@lru_cache(maxsize=1024)
+def _backup_date(value: date) -> str:
+    """Format a date as used in backup file names (e.g. 05Mar2025); batches share few dates"""
+    return value.strftime('%d%b%Y')
+
+
+def _fast_copy(source_file: str, backup_path: Path):
+    """
+    Copy a file, letting the kernel clone it where possible
+
+    os.copy_file_range (Linux) can reflink on copy-on-write filesystems and
+    copies in-kernel elsewhere; any OSError falls back to shutil.copyfile.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source_file, 'rb') as src, open(backup_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(source_file, backup_path)
+
+
+def _copy_backup(source_file: str, backup_path: Path) -> bool:
+    """Copy a source file to its backup location; runs in the backup worker pool"""
+    if not os.path.exists(source_file):
+        return False
+    _fast_copy(source_file, backup_path)
+    return True
+
+
+def _parse_rate(value: str) -> float:
+    """Parse a numeric rate, rejecting non-numeric text before calling float()"""
+    if not _NUM_RE.match(value):
+        raise ValueError(f"Invalid number: {value}")
+    return float(value)
+
 
 @dataclass
 class MRRecord:
@@ -55,16 +134,69 @@ class MRRecord:
         return f"{self.client_id}_{self.asset_id}_{self.ex_date}_{self.pay_date}_{self.mr_income_rate}"
 
 
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints the Fetch / Parse buttons of the Actions column and turns clicks into row signals"""
+
+    fetchRequested = Signal(int)  # row index
+    parseRequested = Signal(int)  # row index
+
+    LABELS = ("Fetch", "Parse")
+    SPACING = 2
+
+    def _buttonRects(self, rect: QRect) -> List[QRect]:
+        width = (rect.width() - self.SPACING) // 2
+        return [
+            QRect(rect.left(), rect.top(), width, rect.height()),
+            QRect(rect.left() + width + self.SPACING, rect.top(), width, rect.height())
+        ]
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(self.LABELS, self._buttonRects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            return False
+
+        pos = event.position().toPoint()
+        fetch_rect, parse_rect = self._buttonRects(option.rect)
+        if fetch_rect.contains(pos):
+            self.fetchRequested.emit(index.row())
+            return True
+        if parse_rect.contains(pos):
+            self.parseRequested.emit(index.row())
+            return True
+        return False
+
+
 class MRUpdateTable(QTableWidget):
     """Custom table widget for MR Update records"""
 
     fetchRequested = Signal(int)  # row index
     parseRequested = Signal(int)  # row index
 
+    # MRRecord attribute per column (None for non-data columns)
+    FIELD_BY_COL = (None, *_BULK_FIELDS, None, None)
+
+    # Row background per status, created once rather than per update
+    STATUS_BRUSHES = {
+        "Success": QBrush(QColor(Qt.GlobalColor.lightGray)),
+        "Failed": QBrush(QColor(Qt.GlobalColor.red)),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.records: List[MRRecord] = []
+        self._row_by_key: Dict[str, int] = {}  # record key -> row index
+        self._resize_pending = False
+        self._dirty_rows = set()  # rows edited by the user but not yet written back
         self.setupUI()
+        self.itemChanged.connect(self._onItemChanged)
 
     def setupUI(self):
         # Set headers
@@ -78,92 +210,205 @@ class MRUpdateTable(QTableWidget):
         self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.setColumnWidth(0, 30)  # Checkbox column
 
+        # Interactive rather than ResizeToContents, which re-measures every row on each insert;
+        # columns are fitted once per batch by scheduleResize()
         for i in range(1, 9):
-            self.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+            self.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
 
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
 
+        # Action buttons are painted by a delegate instead of per-row widgets
+        self.actionDelegate = ActionButtonDelegate(self)
+        self.actionDelegate.fetchRequested.connect(self.fetchRequested)
+        self.actionDelegate.parseRequested.connect(self.parseRequested)
+        self.setItemDelegateForColumn(9, self.actionDelegate)
+
         # Enable context menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.showContextMenu)
 
     def addRecord(self, record: MRRecord):
         """Add or update a record in the table"""
-        # Check if record already exists
-        existing_row = self.findRecord(record.get_key())
+        self.addRecords([record])
 
-        if existing_row >= 0:
-            # Update existing record
-            self.records[existing_row] = record
-            self.updateRow(existing_row, record)
-        else:
-            # Add new record
-            row = self.rowCount()
-            self.insertRow(row)
-            self.records.append(record)
-
-            # Checkbox
-            checkbox = QCheckBox()
-            self.setCellWidget(row, 0, checkbox)
-
-            # Data columns
-            self.setItem(row, 1, QTableWidgetItem(record.client_id))
-            self.setItem(row, 2, QTableWidgetItem(record.asx_code))
-            self.setItem(row, 3, QTableWidgetItem(record.fund))
-            self.setItem(row, 4, QTableWidgetItem(record.asset_id))
-            self.setItem(row, 5, QTableWidgetItem(record.ex_date.strftime("%Y-%m-%d")))
-            self.setItem(row, 6, QTableWidgetItem(record.pay_date.strftime("%Y-%m-%d")))
-            self.setItem(row, 7, QTableWidgetItem(f"{record.mr_income_rate:.6f}"))
-            self.setItem(row, 8, QTableWidgetItem(record.type))
-
-            # Action buttons
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            action_layout.setSpacing(2)
-
-            fetch_btn = QPushButton("Fetch")
-            fetch_btn.clicked.connect(lambda checked, r=row: self.fetchRequested.emit(r))
-            parse_btn = QPushButton("Parse")
-            parse_btn.clicked.connect(lambda checked, r=row: self.parseRequested.emit(r))
-
-            action_layout.addWidget(fetch_btn)
-            action_layout.addWidget(parse_btn)
-
-            self.setCellWidget(row, 9, action_widget)
-
-            # Status
-            self.setItem(row, 10, QTableWidgetItem(record.status))
+    def addRecords(self, records: List[MRRecord]):
+        """Add or update many records, growing the table once and repainting once at the end"""
+        self.applyPendingEdits()
+        self.setUpdatesEnabled(False)
+        signals_blocked = self.blockSignals(True)
+        try:
+            first_row = self.rowCount()
+            new_records: List[MRRecord] = []
+
+            for record in records:
+                key = record.get_key()
+                existing_row = self.findRecord(key)
+
+                if existing_row >= first_row:
+                    # Duplicate within this batch, keep the latest
+                    new_records[existing_row - first_row] = record
+                elif existing_row >= 0:
+                    # Update existing record
+                    self.updateRow(existing_row, record)
+                else:
+                    self._row_by_key[key] = first_row + len(new_records)
+                    new_records.append(record)
+
+            # Add new records
+            self.setRowCount(first_row + len(new_records))
+            self.records.extend(new_records)
+            for row, record in enumerate(new_records, start=first_row):
+                self._fillRow(row, record)
+        finally:
+            self.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(True)
+
+        self.scheduleResize()
+
+    def _fillRow(self, row: int, record: MRRecord):
+        """Populate the cells of a freshly allocated row"""
+        # Checkbox
+        checkbox = QCheckBox()
+        self.setCellWidget(row, 0, checkbox)
+
+        # Data columns
+        for col, text in enumerate(self._rowValues(record), start=1):
+            self.setItem(row, col, QTableWidgetItem(text))
+
+        # Action buttons (painted by ActionButtonDelegate)
+        action_item = QTableWidgetItem()
+        action_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        self.setItem(row, 9, action_item)
+
+        # Status
+        self.setItem(row, 10, QTableWidgetItem(record.status))
+
+    def scheduleResize(self):
+        """Fit the data columns to their contents once the current batch of inserts is done"""
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._resizeColumns)
+
+    def _resizeColumns(self):
+        self._resize_pending = False
+        for i in range(1, 9):
+            self.resizeColumnToContents(i)
 
     def updateRow(self, row: int, record: MRRecord):
         """Update an existing row with new record data"""
         self.records[row] = record
-        self.item(row, 1).setText(record.client_id)
-        self.item(row, 2).setText(record.asx_code)
-        self.item(row, 3).setText(record.fund)
-        self.item(row, 4).setText(record.asset_id)
-        self.item(row, 5).setText(record.ex_date.strftime("%Y-%m-%d"))
-        self.item(row, 6).setText(record.pay_date.strftime("%Y-%m-%d"))
-        self.item(row, 7).setText(f"{record.mr_income_rate:.6f}")
-        self.item(row, 8).setText(record.type)
-        self.item(row, 10).setText(record.status)
+        signals_blocked = self.blockSignals(True)
+        try:
+            for col, text in enumerate(self._rowValues(record), start=1):
+                self.item(row, col).setText(text)
+            self.item(row, 10).setText(record.status)
+        finally:
+            self.blockSignals(signals_blocked)
+
+    @staticmethod
+    def _rowValues(record: MRRecord) -> tuple:
+        """Display text for the data columns (1-8) of a record, in column order"""
+        return (
+            record.client_id,
+            record.asx_code,
+            record.fund,
+            record.asset_id,
+            record.ex_date.isoformat(),
+            record.pay_date.isoformat(),
+            f"{record.mr_income_rate:.6f}",
+            record.type
+        )
+
+    def _reindex(self):
+        """Rebuild the record key -> row index lookup"""
+        self._row_by_key = {record.get_key(): i for i, record in enumerate(self.records)}
+
+    def _onItemChanged(self, item: QTableWidgetItem):
+        """Mark a user-edited row dirty; edits are written back in one pass per event-loop turn"""
+        if self.FIELD_BY_COL[item.column()] is None:
+            return
+
+        if not self._dirty_rows:
+            QTimer.singleShot(0, self.applyPendingEdits)
+        self._dirty_rows.add(item.row())
+
+    def applyPendingEdits(self):
+        """Write dirty rows back into their records, reverting rows with invalid values"""
+        dirty_rows, self._dirty_rows = self._dirty_rows, set()
+        for row in dirty_rows:
+            if 0 <= row < len(self.records):
+                self._applyRowEdits(row)
+
+    def _applyRowEdits(self, row: int):
+        record = self.records[row]
+        shown = self._rowValues(record)
+        values = {}
+        for col, field in enumerate(self.FIELD_BY_COL):
+            if field is None:
+                continue
+            text = self.item(row, col).text().strip()
+            # Only cells the user changed are parsed back; the display text of the
+            # others may be rounded (e.g. the rate's 6 decimals)
+            if text == shown[col - 1]:
+                continue
+            try:
+                if field in ('ex_date', 'pay_date'):
+                    values[field] = date.fromisoformat(text)
+                elif field == 'mr_income_rate':
+                    values[field] = _parse_rate(text)
+                else:
+                    values[field] = text
+            except ValueError:
+                logger.warning(f"Invalid value for {field}: {text}")
+                self.updateRow(row, record)
+                return
+
+        if not values:
+            return
+
+        old_key = record.get_key()
+        for field, value in values.items():
+            setattr(record, field, value)
+        if self._row_by_key.get(old_key) == row:
+            del self._row_by_key[old_key]
+        self._row_by_key[record.get_key()] = row
 
     def findRecord(self, key: str) -> int:
         """Find record by key, return row index or -1 if not found"""
-        for i, record in enumerate(self.records):
-            if record.get_key() == key:
-                return i
-        return -1
+        return self._row_by_key.get(key, -1)
+
+    def rowOf(self, record: MRRecord) -> int:
+        """Current row of a record, or -1 once it has been deleted or replaced"""
+        row = self._row_by_key.get(record.get_key(), -1)
+        return row if row >= 0 and self.records[row] is record else -1
+
+    def updateRecordStatus(self, record: MRRecord, status: str):
+        """
+        Update a record's status wherever its row is now
+
+        Work that awaits in between looks its row up again, since rows may be
+        deleted or the record edited meanwhile.
+        """
+        row = self.rowOf(record)
+        if row >= 0:
+            self.updateStatus(row, status)
+        else:
+            record.status = status
 
-    def getSelectedRecords(self) -> List[MRRecord]:
-        """Get all selected records"""
-        selected = []
+    def getSelectedRows(self) -> List[int]:
+        """Get row indices of all checked rows"""
+        rows = []
         for row in range(self.rowCount()):
             checkbox = self.cellWidget(row, 0)
             if checkbox and checkbox.isChecked():
-                selected.append(self.records[row])
-        return selected
+                rows.append(row)
+        return rows
+
+    def getSelectedRecords(self) -> List[MRRecord]:
+        """Get all selected records"""
+        self.applyPendingEdits()
+        return [self.records[row] for row in self.getSelectedRows()]
 
     def selectAll(self, checked: bool):
         """Select or deselect all rows"""
@@ -237,28 +482,42 @@ class MRUpdateTable(QTableWidget):
 
     def deleteRow(self, row: int):
         """Delete a row"""
-        if 0 <= row < self.rowCount():
-            self.removeRow(row)
-            del self.records[row]
+        self.deleteRows([row])
+
+    def deleteRows(self, rows: List[int]):
+        """Delete several rows, rebuilding the key lookup once"""
+        self.applyPendingEdits()
+        for row in sorted(set(rows), reverse=True):
+            if 0 <= row < self.rowCount():
+                self.removeRow(row)
+                del self.records[row]
+        self._reindex()
 
     def updateStatus(self, row: int, status: str):
         """Update status for a specific row"""
-        if 0 <= row < self.rowCount():
+        if not 0 <= row < self.rowCount():
+            return
+
+        # Status text, colour and lock are not user edits, so they must not reach _onItemChanged
+        signals_blocked = self.blockSignals(True)
+        try:
             self.item(row, 10).setText(status)
             self.records[row].status = status
 
-            # Change row color based on status
-            if status == "Success":
-                for col in range(self.columnCount()):
-                    item = self.item(row, col)
-                    if item:
-                        item.setBackground(Qt.GlobalColor.lightGray)
+            # Change row color based on status ("Failed: <reason>" shares the "Failed" colour)
+            brush = self.STATUS_BRUSHES.get(status.partition(':')[0])
+            if brush is None:
+                return
+
+            lock = status == "Success"
+            for col in range(self.columnCount()):
+                item = self.item(row, col)
+                if item:
+                    item.setBackground(brush)
+                    if lock:
                         item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            elif status == "Failed":
-                for col in range(self.columnCount()):
-                    item = self.item(row, col)
-                    if item:
-                        item.setBackground(Qt.GlobalColor.red)
+        finally:
+            self.blockSignals(signals_blocked)
 
 
 class BulkImportDialog(QDialog):
@@ -276,7 +535,7 @@ class BulkImportDialog(QDialog):
 
         # Instructions
         instructions = BodyLabel(
-            "Paste data in tab-separated format:\n"
+            "Paste data in tab-separated format (a header row with these names may be included, in any order):\n"
             "Client_ID  ASX_Code  Fund  Asset_ID  Ex_Date  Pay_Date  MR_Income_Rate  Type"
         )
         layout.addWidget(instructions)
@@ -295,31 +554,53 @@ class BulkImportDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def getText(self) -> str:
+        """Raw pasted text"""
+        return self.textEdit.toPlainText()
+
     def getData(self) -> List[Dict]:
         """Parse pasted data into list of dictionaries"""
-        text = self.textEdit.toPlainText()
+        return self.parseText(self.getText())
+
+    @staticmethod
+    def parseText(text: str) -> List[Dict]:
+        """Parse tab-separated text into record dictionaries; touches no widgets, so it can run in a worker thread"""
         if not text:
             return []
 
-        lines = text.strip().split('\n')
+        reader = csv.reader(io.StringIO(text.strip()), delimiter='\t', quoting=csv.QUOTE_NONE)
+        first = next(reader, [])
+        header = [cell.strip().lower() for cell in first]
         data = []
 
-        for line in lines:
-            parts = line.split('\t')
-            if len(parts) >= 8:
+        # Resolve the column of each field once from an optional header row
+        pick = None
+        if 'client_id' in header:
+            missing = [field for field in _BULK_FIELDS if field not in header]
+            if missing:
+                logger.warning(f"Bulk import header is missing columns: {missing}")
+                return []
+            columns = [header.index(field) for field in _BULK_FIELDS]
+            pick = operator.itemgetter(*columns)
+            width = max(columns) + 1
+        else:
+            reader = itertools.chain([first], reader)
+            width = len(_BULK_FIELDS)
+
+        for parts in reader:
+            if len(parts) >= width:
+                if pick is not None:
+                    parts = pick(parts)
+                row = dict(zip(_BULK_FIELDS, (part.strip() for part in parts)))
                 try:
-                    data.append({
-                        'client_id': parts[0].strip(),
-                        'asx_code': parts[1].strip(),
-                        'fund': parts[2].strip(),
-                        'asset_id': parts[3].strip(),
-                        'ex_date': datetime.strptime(parts[4].strip(), "%Y%m%d").date(),
-                        'pay_date': datetime.strptime(parts[5].strip(), "%Y%m%d").date(),
-                        'mr_income_rate': float(parts[6].strip()),
-                        'type': parts[7].strip() if len(parts) > 7 else 'Other'
-                    })
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to parse line: {line}, error: {e}")
+                    row['ex_date'] = _parse_yyyymmdd(row['ex_date'])
+                    row['pay_date'] = _parse_yyyymmdd(row['pay_date'])
+                    row['mr_income_rate'] = _parse_rate(row['mr_income_rate'])
+                    # Few distinct types, so share one string object per value
+                    row['type'] = sys.intern(row['type'])
+                    data.append(row)
+                except ValueError as e:
+                    logger.warning(f"Failed to parse line: {parts}, error: {e}")
 
         return data
 
@@ -327,6 +608,8 @@ class BulkImportDialog(QDialog):
 class MrUpdateInterface(BaseInterface):
     """MR Update Interface for managing parsed business records"""
 
+    STATUS_FLUSH_MS = 100
+
     def __init__(self, parent=None):
         super().__init__(
             title="MR Update",
@@ -334,8 +617,14 @@ class MrUpdateInterface(BaseInterface):
             parent=parent
         )
         self.setObjectName('mrUpdateInterface')
-        self.dmh_service = DMH()
+        # Share the main window's DMH client (and its connection pool) when available
+        self.dmh_service = getattr(parent, 'dmh', None) or DMH()
         self.spider_service = SpiderService()
+        self._stats_pending = False
+        # Dedicated pool so backup copies never queue behind other to_thread work
+        self._backupPool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mr-backup")
+        # Settings validate the folder at load; recreate it once here in case it was removed since
+        BACKUP_ROOT.mkdir(parents=True, exist_ok=True)
         self.initUI()
         self.connectSignalToSlot()
 
@@ -420,8 +709,13 @@ class MrUpdateInterface(BaseInterface):
         self.progressBar.setVisible(False)
         self.progressBar.setMaximumWidth(200)
 
-        # Status label
+        # Status label, refreshed at most every STATUS_FLUSH_MS while a batch is running
         self.statusLabel = CaptionLabel("Ready", widget)
+        self._pendingStatus = None
+        self.statusTimer = QTimer(self)
+        self.statusTimer.setSingleShot(True)
+        self.statusTimer.setInterval(self.STATUS_FLUSH_MS)
+        self.statusTimer.timeout.connect(self._flushStatus)
 
         # Statistics
         self.statsLabel = CaptionLabel("Total: 0 | Pending: 0 | Success: 0 | Failed: 0", widget)
@@ -451,6 +745,8 @@ class MrUpdateInterface(BaseInterface):
         """Handle MR Update signal from signal bus"""
         if action == 'add':
             self.addRecordFromData(data)
+        elif action == 'add_many':
+            self.addRecordsFromData(data['records'])
         elif action == 'update':
             # Update existing record
             pass
@@ -464,27 +760,28 @@ class MrUpdateInterface(BaseInterface):
 
     def addRecordFromData(self, data: dict):
         """Add record from parsed data"""
+        self.addRecordsFromData([data])
+
+    def addRecordsFromData(self, data_list: List[dict]):
+        """Add a batch of parsed results with one table insert and one statistics refresh"""
+        today = date.today()
+        self.recordsTable.addRecords([self._recordFromData(data, today) for data in data_list])
+        self.scheduleStatisticsUpdate()
+
+    @staticmethod
+    def _recordFromData(data: dict, today: date) -> MRRecord:
+        """Build an MRRecord from a parser result, defaulting missing dates to today"""
         header = data.get('header', {})
-        payload = data.get('data', {})
-
-        # Create MRRecord
-        record = MRRecord(
-            client_id=header.get('client_id', ''),
-            asx_code=header.get('asx_code', ''),
-            fund=header.get('fund', ''),
-            asset_id=header.get('asset_id', ''),
-            ex_date=header.get('ex_date', datetime.now().date()),
-            pay_date=header.get('pay_date', datetime.now().date()),
-            mr_income_rate=header.get('mr_income_rate', 0.0),
-            type=header.get('type', 'Other'),
-            data_payload=payload,
+        fields = dict(_RECORD_DEFAULTS, ex_date=today, pay_date=today)
+        fields.update({key: header[key] for key in header.keys() & fields.keys()})
+
+        return MRRecord(
+            **fields,
+            data_payload=data.get('data', {}),
             source_file=data.get('source_file'),
             template=data.get('template')
         )
 
-        self.recordsTable.addRecord(record)
-        self.updateStatistics()
-
     def onSelectAll(self, checked: bool):
         """Handle select all checkbox"""
         self.recordsTable.selectAll(checked)
@@ -493,48 +790,40 @@ class MrUpdateInterface(BaseInterface):
     @raise_error_bar_in_class
     async def onSubmit(self):
         """Submit selected records to DMH"""
-        selected = self.recordsTable.getSelectedRecords()
+        selected = self.recordsTable.getSelectedRows()
         if not selected:
             createWarningInfoBar(self, "No Selection", "Please select records to submit")
             return
 
+        # Rows already accepted by DMH are locked, so there is nothing to resubmit
+        self.recordsTable.applyPendingEdits()
+        records = self.recordsTable.records
+        # Submissions hold the records themselves; rows can move while they are awaited
+        selected = [records[row] for row in selected if records[row].status != "Success"]
+        if not selected:
+            createWarningInfoBar(self, "Already Submitted", "All selected records were already submitted")
+            return
+
         try:
             self.submitBtn.setEnabled(False)
             self.progressBar.setVisible(True)
             self.progressBar.setMaximum(len(selected))
+            self.progressBar.setValue(0)
 
-            success_count = 0
-            failed_count = 0
-
-            for i, record in enumerate(selected):
-                self.progressBar.setValue(i)
-                self.statusLabel.setText(f"Submitting {record.asset_id}...")
-
-                try:
-                    # Find the row for this record
-                    row = self.recordsTable.findRecord(record.get_key())
-                    self.recordsTable.updateStatus(row, "Submitting...")
-
-                    # Submit to DMH
-                    result = await self.dmh_service.submit_mr_data(record)
-
-                    if result['success']:
-                        self.recordsTable.updateStatus(row, "Success")
-                        success_count += 1
+            # Submissions are independent, so run them concurrently up to the DMH limit
+            semaphore = asyncio.Semaphore(CONFIG.dmh.concurrent_limit)
 
-                        # Save backup file
-                        self.saveBackupFile(record)
-                    else:
-                        self.recordsTable.updateStatus(row, f"Failed: {result.get('error', 'Unknown')}")
-                        failed_count += 1
+            async def submit_with_limit(record: MRRecord) -> bool:
+                async with semaphore:
+                    success = await self._submitRecord(record)
+                self.progressBar.setValue(self.progressBar.value() + 1)
+                return success
 
-                except Exception as e:
-                    logger.error(f"Failed to submit record: {e}")
-                    self.recordsTable.updateStatus(row, f"Failed: {str(e)}")
-                    failed_count += 1
+            results = await asyncio.gather(*(submit_with_limit(record) for record in selected))
+            success_count = sum(results)
+            failed_count = len(results) - success_count
 
-            self.progressBar.setValue(len(selected))
-            self.statusLabel.setText("Submission complete")
+            self.setStatus("Submission complete")
 
             createSuccessInfoBar(
                 self,
@@ -547,18 +836,39 @@ class MrUpdateInterface(BaseInterface):
             self.progressBar.setVisible(False)
             self.updateStatistics()
 
+    async def _submitRecord(self, record: MRRecord) -> bool:
+        """Submit a single record to DMH, returning whether it succeeded"""
+        self.setStatus(f"Submitting {record.asset_id}...")
+
+        try:
+            self.recordsTable.updateRecordStatus(record, "Submitting...")
+
+            # Submit to DMH
+            result = await self.dmh_service.submit_mr_data(record)
+
+            if result['success']:
+                self.recordsTable.updateRecordStatus(record, "Success")
+
+                # Save backup file
+                await self.saveBackupFile(record)
+                return True
+
+            self.recordsTable.updateRecordStatus(record, f"Failed: {result.get('error', 'Unknown')}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Failed to submit record: {e}")
+            self.recordsTable.updateRecordStatus(record, f"Failed: {str(e)}")
+            return False
+
     def onDelete(self):
         """Delete selected records"""
-        selected = self.recordsTable.getSelectedRecords()
+        selected = self.recordsTable.getSelectedRows()
         if not selected:
             createWarningInfoBar(self, "No Selection", "Please select records to delete")
             return
 
-        # Delete from bottom to top to maintain row indices
-        for record in reversed(selected):
-            row = self.recordsTable.findRecord(record.get_key())
-            if row >= 0:
-                self.recordsTable.deleteRow(row)
+        self.recordsTable.deleteRows(selected)
 
         self.updateStatistics()
         createSuccessInfoBar(self, "Deleted", f"Deleted {len(selected)} records")
@@ -567,13 +877,18 @@ class MrUpdateInterface(BaseInterface):
         """Handle bulk import"""
         dialog = BulkImportDialog(self)
         if dialog.exec():
-            data_list = dialog.getData()
-            for data in data_list:
-                record = MRRecord(**data)
-                self.recordsTable.addRecord(record)
+            asyncio.ensure_future(self._importBulkText(dialog.getText()))
 
-            self.updateStatistics()
-            createSuccessInfoBar(self, "Import Complete", f"Imported {len(data_list)} records")
+    @raise_error_bar_in_class
+    async def _importBulkText(self, text: str):
+        """Parse pasted bulk data in a worker thread, then insert it as one batch"""
+        self.setStatus("Parsing pasted data...")
+        data_list = await asyncio.to_thread(BulkImportDialog.parseText, text)
+        self.recordsTable.addRecords([MRRecord(**data) for data in data_list])
+
+        self.setStatus("Ready")
+        self.updateStatistics()
+        createSuccessInfoBar(self, "Import Complete", f"Imported {len(data_list)} records")
 
     def onRefresh(self):
         """Refresh table display"""
@@ -587,7 +902,7 @@ class MrUpdateInterface(BaseInterface):
             record = self.recordsTable.records[row]
 
             try:
-                self.recordsTable.updateStatus(row, "Fetching...")
+                self.recordsTable.updateRecordStatus(record, "Fetching...")
 
                 # Search for announcement in database
                 announcements = self.spider_service.get_announcements_by_criteria(
@@ -605,18 +920,18 @@ class MrUpdateInterface(BaseInterface):
                     )
 
                     if success:
-                        self.recordsTable.updateStatus(row, "Pending parse")
+                        self.recordsTable.updateRecordStatus(record, "Pending parse")
                         record.source_file = str(pdf_path)
                         createSuccessInfoBar(self, "Fetched", "PDF downloaded successfully")
                     else:
-                        self.recordsTable.updateStatus(row, "Fetch failed")
+                        self.recordsTable.updateRecordStatus(record, "Fetch failed")
                 else:
-                    self.recordsTable.updateStatus(row, "Not found")
+                    self.recordsTable.updateRecordStatus(record, "Not found")
                     createWarningInfoBar(self, "Not Found", "No matching announcement found")
 
             except Exception as e:
                 logger.error(f"Fetch error: {e}")
-                self.recordsTable.updateStatus(row, "Error")
+                self.recordsTable.updateRecordStatus(record, "Error")
                 raise
 
     def onParseRecord(self, row: int):
@@ -639,24 +954,50 @@ class MrUpdateInterface(BaseInterface):
                     break
                 parent = parent.parent()
 
-    def saveBackupFile(self, record: MRRecord):
-        """Save backup file after successful submission"""
-        if record.source_file and os.path.exists(record.source_file):
+    async def saveBackupFile(self, record: MRRecord):
+        """Save backup file after successful submission, copying in a worker thread"""
+        if record.source_file:
             # Generate backup filename
             template_type = "ACT" if record.template == "Hi-Trust UR" else "EST"
-            backup_name = f"{record.asset_id}_{record.client_id}_{record.ex_date.strftime('%d%b%Y')}_{template_type}"
-            backup_path = CONFIG.paths.backup_path / backup_name
-
-            # Copy file to back-up location
-            import shutil
-            shutil.copy2(record.source_file, backup_path)
-            logger.info(f"Backup saved: {backup_path}")
+            suffix = os.path.splitext(record.source_file)[1]
+            backup_name = "_".join(
+                (record.asset_id, record.client_id, _backup_date(record.ex_date), template_type)) + suffix
+            backup_path = BACKUP_ROOT / backup_name
+
+            # Check and copy in the backup pool so neither touches the disk on the event loop
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(self._backupPool, _copy_backup, record.source_file, backup_path):
+                logger.info(f"Backup saved: {backup_path}")
+
+    def setStatus(self, text: str):
+        """Queue a status message; only the latest one per flush interval is drawn"""
+        self._pendingStatus = text
+        if not self.statusTimer.isActive():
+            self.statusTimer.start()
+
+    def _flushStatus(self):
+        if self._pendingStatus is not None:
+            self.statusLabel.setText(self._pendingStatus)
+            self._pendingStatus = None
+
+    def scheduleStatisticsUpdate(self):
+        """Coalesce statistics refreshes so a burst of adds updates the label once"""
+        if not self._stats_pending:
+            self._stats_pending = True
+            QTimer.singleShot(50, self.updateStatistics)
 
     def updateStatistics(self):
         """Update statistics display"""
-        total = len(self.recordsTable.records)
-        pending = sum(1 for r in self.recordsTable.records if r.status == "Pending")
-        success = sum(1 for r in self.recordsTable.records if r.status == "Success")
-        failed = sum(1 for r in self.recordsTable.records if "Failed" in r.status)
+        self._stats_pending = False
+        records = self.recordsTable.records
+        total = len(records)
+        pending = success = failed = 0
+        for r in records:
+            if r.status == "Pending":
+                pending += 1
+            elif r.status == "Success":
+                success += 1
+            elif "Failed" in r.status:
+                failed += 1
 
         self.statsLabel.setText(f"Total: {total} | Pending: {pending} | Success: {success} | Failed: {failed}")
\ No newline at end of file
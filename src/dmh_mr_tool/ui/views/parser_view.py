@@ -3,29 +3,35 @@
 
 import os
 import re
+import asyncio
+import itertools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, date
+from dataclasses import dataclass
 
-from PySide6.QtCore import Qt, Signal, QMimeData
+from PySide6.QtCore import Qt, Signal, QMimeData, QAbstractTableModel, QModelIndex, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QHeaderView, QAbstractItemView, QStyledItemDelegate,
     QDialog, QDialogButtonBox, QFormLayout,
-    QFileDialog
+    QFileDialog, QProgressBar
 )
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from qfluentwidgets import (
     CardWidget, StrongBodyLabel, BodyLabel, CaptionLabel,
     PrimaryPushButton, PushButton, ComboBox, CheckBox,
-    LineEdit, FluentIcon as FIF, DatePicker, TableWidget
+    LineEdit, FluentIcon as FIF, DatePicker, TableView
 )
 from qasync import asyncSlot
 
 from ..views.base_view import BaseInterface, SeparatorWidget
 from ui.utils.signal_bus import signalBus
 from ui.utils.infobar import raise_error_bar_in_class, createWarningInfoBar, createSuccessInfoBar, createErrorInfoBar
-from business.services.parser_service import ParserService
+from business.services.parser_service import (
+    ParserService, compile_pattern, is_supported_file, list_supported_files, match_value
+)
 from database.models import ParseTemplateMR, ParseTemplateNZ
 from config.settings import CONFIG
 
@@ -39,6 +45,23 @@ class DragDropArea(CardWidget):
 
     fileDropped = Signal(str)
 
+    STYLE_SHEET = """
+        DragDropArea {
+            background-color: #f0f0f0;
+            border: 2px dashed #999;
+            border-radius: 8px;
+            min-height: 200px;
+        }
+        DragDropArea:hover {
+            background-color: #e8e8e8;
+            border-color: #666;
+        }
+        DragDropArea[dropActive="true"] {
+            background-color: #e0f0ff;
+            border-color: #0078d4;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
@@ -71,47 +94,32 @@ class DragDropArea(CardWidget):
         layout.addWidget(sub_label)
         layout.addWidget(self.browseBtn)
 
-        # Styling
-        self.setStyleSheet("""
-            DragDropArea {
-                background-color: #f0f0f0;
-                border: 2px dashed #999;
-                border-radius: 8px;
-                min-height: 200px;
-            }
-            DragDropArea:hover {
-                background-color: #e8e8e8;
-                border-color: #666;
-            }
-        """)
+        # Styling; drag feedback toggles the dropActive property instead of swapping sheets
+        self.setProperty("dropActive", False)
+        self.setStyleSheet(self.STYLE_SHEET)
+
+    def setDropActive(self, active: bool):
+        """Switch the drag-over highlight; only the property selector is re-evaluated"""
+        if self.property("dropActive") == active:
+            return
+        self.setProperty("dropActive", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
+        # Only offer the drop when at least one dragged file can be parsed
+        if any(is_supported_file(u.toLocalFile()) for u in event.mimeData().urls()):
             event.acceptProposedAction()
-            self.setStyleSheet("""
-                DragDropArea {
-                    background-color: #e0f0ff;
-                    border: 2px dashed #0078d4;
-                    border-radius: 8px;
-                    min-height: 200px;
-                }
-            """)
+            self.setDropActive(True)
 
     def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            DragDropArea {
-                background-color: #f0f0f0;
-                border: 2px dashed #999;
-                border-radius: 8px;
-                min-height: 200px;
-            }
-        """)
+        self.setDropActive(False)
 
     def dropEvent(self, event: QDropEvent):
-        files = [u.toLocalFile() for u in event.mimeData().urls()]
-        if files:
-            self.fileDropped.emit(files[0])
-        self.dragLeaveEvent(event)
+        file_path = next((f for f in (u.toLocalFile() for u in event.mimeData().urls()) if is_supported_file(f)), None)
+        if file_path:
+            self.fileDropped.emit(file_path)
+        self.setDropActive(False)
 
     def browseFiles(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -124,185 +132,345 @@ class DragDropArea(CardWidget):
             self.fileDropped.emit(file_path)
 
 
-class EditablePatternDelegate(QWidget):
-    """Widget for editing regex patterns in table cells"""
+class PatternDelegate(QStyledItemDelegate):
+    """Editor for the pattern column; the line edit only exists while a cell is being edited"""
+
+    def createEditor(self, parent, option, index):
+        editor = LineEdit(parent)
+        editor.setToolTip("Press Enter to apply the pattern")
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(Qt.ItemDataRole.EditRole) or '')
+        editor.selectAll()
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
+
+
+# Batch file names: {Asset_ID}_{Client_ID}_{Ex_Date}_{ACT/EST}, e.g. ABC_123_05Mar2024_ACT
+_BATCH_NAME_RE = re.compile(r'([^_]*)(?:_([^_]*))?(?:_(\d{1,2})([A-Za-z]{3})(\d{4})(?=_|$))?')
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'), start=1
+    )
+}
+
+
+# Batch processing always parses with this template and submits its files as this type
+BATCH_TEMPLATE = 'Hi-Trust UR'
+BATCH_TYPE = 'Last Actual'  # Hi-Trust UR uses ACT type
+
+
+def _build_submission(file_path: Path, results: Dict[str, Dict[str, Any]],
+                      timestamp: datetime) -> Optional[Dict[str, Any]]:
+    """MR Update submission for a batch file, with the header taken from its file name; None if no value was parsed"""
+    data = {k: value for k, v in results.items() if (value := v.get('value'))}
+    if not data:
+        return None
+
+    # Extract header info from filename if possible
+    # Format: {Asset_ID}_{Client_ID}_{Ex_Date}_{ACT/EST}
+    asset_id, client_id, day, month, year = _BATCH_NAME_RE.match(file_path.stem).groups()
+
+    header_data = {
+        'asset_id': asset_id,
+        'client_id': client_id or '',
+        'type': BATCH_TYPE
+    }
 
-    patternChanged = Signal(str)
+    # Try to parse date from filename; only an impossible day can still fail
+    month_number = _MONTHS.get(month.upper()) if year else None
+    if month_number:
+        try:
+            header_data['ex_date'] = date(int(year), month_number, int(day))
+        except ValueError:
+            pass
+
+    return {
+        'header': header_data,
+        'data': data,
+        'source_file': str(file_path),
+        'template': BATCH_TEMPLATE,
+        'timestamp': timestamp
+    }
+
+
+def _display(value) -> str:
+    """Cell text for a parsed value; None shows as empty"""
+    return '' if value is None else str(value)
+
+
+@dataclass
+class ParseRow:
+    """One parsed field shown in the results table"""
+    field_name: str
+    desc: str
+    pattern: str = ''
+    value: str = ''
+    comment: str = ''
+    hidden: bool = False  # no value was parsed
+    deleted: bool = False
 
-    def __init__(self, initial_pattern="", parent=None):
+
+class ParseResultsModel(QAbstractTableModel):
+    """Table model holding one row per parsed field"""
+
+    patternEdited = Signal(int, str)  # row, new_pattern
+
+    HEADERS = ("Column Name", "Pattern", "Value", "Comment")
+    NAME_COL, PATTERN_COL, VALUE_COL, COMMENT_COL = range(4)
+
+    # Item flags are asked for per cell on every paint, so they are combined once here
+    EDITABLE_COLS = frozenset({PATTERN_COL, VALUE_COL})
+    READ_ONLY_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    EDITABLE_FLAGS = READ_ONLY_FLAGS | Qt.ItemFlag.ItemIsEditable
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.layout = QHBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
+        self._rows: List[ParseRow] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.UserRole:
+            return row.field_name
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == self.NAME_COL:
+                return row.desc
+            if col == self.PATTERN_COL:
+                pattern = row.pattern
+                if role == Qt.ItemDataRole.DisplayRole and len(pattern) > 50:
+                    return pattern[:50] + '...'
+                return pattern
+            if col == self.VALUE_COL:
+                return row.value
+            return row.comment
+        if role == Qt.ItemDataRole.ToolTipRole and col == self.PATTERN_COL:
+            return row.pattern
+        return None
+
+    def flags(self, index: QModelIndex):
+        return self.EDITABLE_FLAGS if index.column() in self.EDITABLE_COLS else self.READ_ONLY_FLAGS
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.EditRole:
+            return False
+
+        row = self._rows[index.row()]
+        col = index.column()
+        if col == self.VALUE_COL:
+            row.value = str(value)
+        elif col == self.PATTERN_COL:
+            if value == row.pattern:
+                return True
+            row.pattern = value
+        else:
+            return False
+
+        self.dataChanged.emit(index, index)
+        if col == self.PATTERN_COL:
+            self.patternEdited.emit(index.row(), value)
+        return True
+
+    def setRows(self, rows: List[ParseRow]):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
 
-        self.edit = LineEdit(initial_pattern)
-        self.edit.setToolTip("Double-click to edit pattern")
-        self.edit.editingFinished.connect(self.onEditingFinished)
-        self.layout.addWidget(self.edit)
+    def appendRow(self, row: ParseRow) -> int:
+        """Append a row and return its index"""
+        return self.appendRows([row])
 
-        # Initially read-only, double-click to edit
-        self.edit.setReadOnly(True)
-        self.edit.mouseDoubleClickEvent = self.enableEdit
+    def appendRows(self, rows: List[ParseRow]) -> int:
+        """Append rows in a single insertion and return the index of the first"""
+        position = len(self._rows)
+        if rows:
+            self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        return position
 
-    def enableEdit(self, event):
-        self.edit.setReadOnly(False)
-        self.edit.selectAll()
-        self.edit.setFocus()
+    def row(self, row: int) -> ParseRow:
+        return self._rows[row]
 
-    def onEditingFinished(self):
-        self.edit.setReadOnly(True)
-        self.patternChanged.emit(self.edit.text())
+    def rows(self) -> List[ParseRow]:
+        return self._rows
 
-    def getPattern(self):
-        return self.edit.text()
+    def updateRow(self, row: int, **fields):
+        """Update fields of a row and refresh its cells"""
+        target = self._rows[row]
+        for name, value in fields.items():
+            setattr(target, name, value)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
 
 
-class ParseResultTable(TableWidget):
-    """Table widget for displaying parse results"""
+class ParseResultTable(TableView):
+    """Table view for displaying parse results"""
 
     patternChanged = Signal(int, str)  # row, new_pattern
     rowDeleted = Signal(int)  # row
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.resultsModel = ParseResultsModel(self)
+        # Row identity comes from the edited model index, so one connection serves every row
+        self.resultsModel.patternEdited.connect(self.patternChanged)
+        self.setModel(self.resultsModel)
+        self.compiled_patterns: Dict[str, tuple] = {}  # field_name -> (pattern, compiled pattern)
+        self._showHidden = False  # whether rows without a parsed value are shown
+        self._pendingRows: List[ParseRow] = []  # rows without a value, added to the model once first shown
+        self._fieldDescs: set = set()  # descriptions of every row, shown or pending
         self.setupUI()
-        self.hidden_rows = []  # Track which rows are hidden due to None values
-        self.pattern_widgets = {}  # Track pattern edit widgets
-        self.deleted_rows = set()  # Track deleted rows
 
     def setupUI(self):
-        # Set headers
-        self.setColumnCount(4)
-        self.setHorizontalHeaderLabels(["Column Name", "Pattern", "Value", "Comment"])
-
         # Configure table
         self.horizontalHeader().setStretchLastSection(True)
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        # Sized once per load rather than ResizeToContents, which re-measures every row on each change
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
         self.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
         self.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+
+        # Patterns are edited on double-click through a shared delegate
+        self.patternDelegate = PatternDelegate(self)
+        self.setItemDelegateForColumn(ParseResultsModel.PATTERN_COL, self.patternDelegate)
+
+    def clearResults(self):
+        """Drop all rows and tracking state in one pass"""
+        self.resultsModel.setRows([])
+        self._pendingRows = []
+        self._fieldDescs = set()
+        self.compiled_patterns = {}
 
     def loadParseResults(self, results: Dict[str, Dict[str, Any]], template_data: Dict[str, str]):
         """Load parse results into the table"""
-        self.clear()
-        self.setRowCount(0)
-        self.hidden_rows.clear()
-        self.pattern_widgets.clear()
-        self.deleted_rows.clear()
-
-        # Add all columns from column_map
-        row_index = 0
+        rows = []
+        pending = []
         for field_name, field_data in results.items():
-            self.insertRow(row_index)
-
-            # Column name
-            name_item = QTableWidgetItem(field_data.get('d_desc', field_name))
-            name_item.setData(Qt.ItemDataRole.UserRole, field_name)  # Store field name
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.setItem(row_index, 0, name_item)
-
-            # Pattern (editable via double-click)
-            pattern = template_data.get(field_name, '')
-            pattern_widget = EditablePatternDelegate(pattern[:50] + '...' if len(pattern) > 50 else pattern)
-            pattern_widget.setToolTip(pattern)
-            pattern_widget.patternChanged.connect(lambda p, r=row_index: self.onPatternChanged(r, p))
-            self.setCellWidget(row_index, 1, pattern_widget)
-            self.pattern_widgets[row_index] = pattern_widget
-
-            # Value (editable)
             value = field_data.get('value', '')
-            value_item = QTableWidgetItem(str(value) if value is not None else '')
-            self.setItem(row_index, 2, value_item)
-
-            # Comment
-            comment = field_data.get('comment', '')
-            comment_item = QTableWidgetItem(comment)
-            comment_item.setFlags(comment_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.setItem(row_index, 3, comment_item)
-
-            # Hide row if value is None
-            if value is None or value == '':
-                self.hideRow(row_index)
-                self.hidden_rows.append(row_index)
-
-            row_index += 1
-
-    def onPatternChanged(self, row: int, new_pattern: str):
-        """Handle pattern change"""
-        self.patternChanged.emit(row, new_pattern)
+            row = ParseRow(
+                field_name,
+                field_data.get('d_desc', field_name),
+                template_data.get(field_name, ''),
+                _display(value),
+                field_data.get('comment', ''),
+                # Hide row if value is None
+                hidden=value is None or value == ''
+            )
+            # Rows that would start hidden stay out of the model until shown
+            (pending if row.hidden and not self._showHidden else rows).append(row)
+        self._pendingRows = pending
+        self._fieldDescs = {row.desc for row in itertools.chain(rows, pending)}
+
+        # Compile the template's patterns up front; invalid ones are reported
+        # when they are next applied
+        self.compiled_patterns = {}
+        for field_name, pattern in template_data.items():
+            if pattern:
+                try:
+                    self.compiled_patterns[field_name] = (pattern, compile_pattern(pattern))
+                except re.error:
+                    pass
+
+        self.resultsModel.setRows(rows)
+        self.resizeColumnToContents(ParseResultsModel.NAME_COL)
+
+    def compiledPattern(self, row: int, pattern: str):
+        """Compiled form of a row's pattern, compiling only when it differs from the cached one"""
+        field_name = self.fieldName(row)
+        cached = self.compiled_patterns.get(field_name)
+        if cached is not None and cached[0] == pattern:
+            return cached[1]
+        compiled = compile_pattern(pattern)
+        self.compiled_patterns[field_name] = (pattern, compiled)
+        return compiled
+
+    def searchPattern(self, row: int, pattern: str, text: str):
+        """First match of a row's pattern in the whole text, as a full parse would find it"""
+        return self.compiledPattern(row, pattern).search(text)
+
+    def fieldName(self, row: int) -> str:
+        """Field name of a row"""
+        return self.resultsModel.row(row).field_name
+
+    def fieldDescs(self) -> set:
+        """Descriptions of all fields currently in the table, kept up to date as rows are added"""
+        return self._fieldDescs
+
+    def setResult(self, row: int, comment: str, value: Optional[str] = None):
+        """Show a re-parse outcome for a row; the value is left as is when not given"""
+        if value is None:
+            self.resultsModel.updateRow(row, comment=comment)
+        else:
+            self.resultsModel.updateRow(row, value=value, comment=comment)
 
     def showHiddenRows(self, show: bool):
         """Show or hide rows with None values"""
-        for row in self.hidden_rows:
-            if row not in self.deleted_rows:
-                if show:
-                    self.showRow(row)
-                else:
-                    self.hideRow(row)
+        self._showHidden = show
+        self.setUpdatesEnabled(False)
+        try:
+            if show and self._pendingRows:
+                # Appended after the rows that have values
+                self.resultsModel.appendRows(self._pendingRows)
+                self._pendingRows = []
+                self.resizeColumnToContents(ParseResultsModel.NAME_COL)
+            for row_index, row in enumerate(self.resultsModel.rows()):
+                if row.hidden and not row.deleted:
+                    self.setRowHidden(row_index, not show)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def deleteSelectedRow(self):
         """Delete the currently selected row"""
-        current_row = self.currentRow()
+        current_row = self.currentIndex().row()
         if current_row >= 0:
             # Clear value and hide row
-            self.item(current_row, 2).setText('')
+            self.resultsModel.updateRow(current_row, value='', deleted=True)
             self.hideRow(current_row)
-            self.deleted_rows.add(current_row)
             self.rowDeleted.emit(current_row)
             return True
         return False
 
     def addNewRow(self, field_name: str, field_desc: str):
         """Add a new row for a field"""
-        row_index = self.rowCount()
-        self.insertRow(row_index)
-
-        # Column name
-        name_item = QTableWidgetItem(field_desc)
-        name_item.setData(Qt.ItemDataRole.UserRole, field_name)
-        name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.setItem(row_index, 0, name_item)
-
-        # Pattern (empty, editable)
-        pattern_widget = EditablePatternDelegate("")
-        pattern_widget.patternChanged.connect(lambda p, r=row_index: self.onPatternChanged(r, p))
-        self.setCellWidget(row_index, 1, pattern_widget)
-        self.pattern_widgets[row_index] = pattern_widget
-
-        # Value (editable)
-        value_item = QTableWidgetItem("")
-        self.setItem(row_index, 2, value_item)
-
-        # Comment
-        comment_item = QTableWidgetItem("Manually added")
-        comment_item.setFlags(comment_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.setItem(row_index, 3, comment_item)
+        self.resultsModel.appendRow(ParseRow(field_name, field_desc, comment="Manually added"))
+        self._fieldDescs.add(field_desc)
+        self.resizeColumnToContents(ParseResultsModel.NAME_COL)
 
     def getValues(self) -> Dict[str, Any]:
-        """Get all values from the table"""
-        values = {}
-        for row in range(self.rowCount()):
-            if not self.isRowHidden(row) and row not in self.deleted_rows:
-                name_item = self.item(row, 0)
-                if name_item:
-                    field_name = name_item.data(Qt.ItemDataRole.UserRole) or name_item.text()
-                    value = self.item(row, 2).text() if self.item(row, 2) else ''
-                    if value:  # Only include non-empty values
-                        values[field_name] = value
-        return values
+        """Get all values from the table; rows not yet added have no value"""
+        show_hidden = self._showHidden
+        return {
+            row.field_name: row.value
+            for row in self.resultsModel.rows()
+            if row.value and not row.deleted and (show_hidden or not row.hidden)
+        }
 
     def getPatterns(self) -> Dict[str, str]:
         """Get all patterns from the table"""
-        patterns = {}
-        for row in range(self.rowCount()):
-            if row not in self.deleted_rows:
-                name_item = self.item(row, 0)
-                if name_item and row in self.pattern_widgets:
-                    field_name = name_item.data(Qt.ItemDataRole.UserRole) or name_item.text()
-                    pattern = self.pattern_widgets[row].getPattern()
-                    if pattern:
-                        patterns[field_name] = pattern
-        return patterns
+        return {
+            row.field_name: row.pattern
+            for row in itertools.chain(self.resultsModel.rows(), self._pendingRows)
+            if row.pattern and not row.deleted
+        }
 
 
 class AddFieldDialog(QDialog):
@@ -423,6 +591,21 @@ class ParserInterface(BaseInterface):
     # Signal to send data to MR Update Interface
     dataSubmitted = Signal(dict)
 
+    # Delay before edited patterns are re-applied, so rapid edits coalesce
+    PATTERN_DEBOUNCE_MS = 200
+
+    # Batch files parsed at once; each parse runs in a worker thread
+    BATCH_CONCURRENCY = min(8, os.cpu_count() or 4)
+
+    # Parse results kept for unchanged files
+    PARSE_CACHE_SIZE = 256
+
+    # Batch submissions sent to MR Update per signal
+    BATCH_EMIT_SIZE = 64
+
+    # Failed batch files named in the summary; the rest are only counted
+    FAILED_FILES_SHOWN = 5
+
     def __init__(self, parent=None):
         super().__init__(
             title="Parser",
@@ -433,8 +616,17 @@ class ParserInterface(BaseInterface):
         self.parser_service = ParserService()
         self.current_file_path = None
         self.current_file_content = None  # Store file content for re-parsing
+        self._full_text = None  # extracted PDF text of the current file, reused across pattern edits
         self.current_template = None
         self.parse_results = {}
+        # (path, mtime_ns, size, template, template patterns) -> parse results, least recently used first
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._parse_task: Optional[asyncio.Task] = None  # parse in progress, cancelled by Clear or a new parse
+        self._pending_patterns: Dict[int, str] = {}  # row -> latest edited pattern
+        self._rows_generation = 0  # bumped whenever the result rows are about to be replaced
+        self._patternTimer = QTimer(self)
+        self._patternTimer.setSingleShot(True)
+        self._patternTimer.timeout.connect(self._flushPatternChanges)
         self.initUI()
         self.connectSignalToSlot()
 
@@ -582,13 +774,19 @@ class ParserInterface(BaseInterface):
         self.batchProcessBtn.setIcon(FIF.PLAY)
         self.batchProcessBtn.clicked.connect(self.onBatchProcess)
 
+        # Progress bar, shown while a batch is running
+        self.batchProgressBar = QProgressBar(widget)
+        self.batchProgressBar.setVisible(False)
+        self.batchProgressBar.setMaximumWidth(200)
+
         layout.addWidget(BodyLabel("Folder Path:", widget))
         layout.addWidget(self.folderPathEdit)
         layout.addWidget(self.browseFolderBtn)
         layout.addWidget(self.batchProcessBtn)
+        layout.addWidget(self.batchProgressBar)
         layout.addStretch()
 
-        title = StrongBodyLabel("Batch Processing (Hi-Trust UR Template)")
+        title = StrongBodyLabel(f"Batch Processing ({BATCH_TEMPLATE} Template)")
         self.body_layout.addWidget(title)
         self.body_layout.addWidget(widget)
 
@@ -600,6 +798,9 @@ class ParserInterface(BaseInterface):
 
     def loadTemplates(self):
         """Load available templates"""
+        # Templates may have changed, so earlier templates and results no longer apply
+        self.parser_service.clear_template_cache()
+        self._parse_cache.clear()
         templates = self.parser_service.get_available_templates()
         self.templateCombo.clear()
         self.templateCombo.addItems(templates)
@@ -607,11 +808,18 @@ class ParserInterface(BaseInterface):
     def onFileSelected(self, file_path: str):
         """Handle file selection"""
         self.current_file_path = file_path
-        self.currentFileLabel.setText(f"Selected: {os.path.basename(file_path)}")
+        self._full_text = None
+        self._dropPendingPatterns()
+        file_name = os.path.basename(file_path)
+        self.currentFileLabel.setText(f"Selected: {file_name}")
         self.parseBtn.setEnabled(True)
 
+        # Start extracting the text now so Parse and pattern edits find it cached
+        if file_name.lower().endswith('.pdf'):
+            asyncio.ensure_future(self.parser_service.text_cache.warm(file_path))
+
         # Auto-select template based on file name
-        template = self.parser_service.get_template_by_file_pattern(os.path.basename(file_path))
+        template = self.parser_service.get_template_by_file_pattern(file_name)
         if template:
             index = self.templateCombo.findText(template)
             if index >= 0:
@@ -625,12 +833,19 @@ class ParserInterface(BaseInterface):
             createWarningInfoBar(self, "No File", "Please select a file to parse")
             return
 
+        # A new parse supersedes one still running
+        self._cancelParse()
+        self._parse_task = task = asyncio.current_task()
+        cancelled = False
+
         try:
             self.parseBtn.setEnabled(False)
             template_name = self.templateCombo.currentText()
+            # Read templates afresh, so edits saved since the last parse apply
+            self.parser_service.clear_template_cache()
 
-            # Parse the file
-            results = await self.parser_service.parse_file(
+            # Parse the file in a worker thread
+            results = await self.parseFileCached(
                 self.current_file_path,
                 template_name
             )
@@ -641,6 +856,7 @@ class ParserInterface(BaseInterface):
 
                 # Load results into table
                 template_data = self.parser_service.get_template_data(template_name)
+                self._dropPendingPatterns()
                 self.resultsTable.loadParseResults(results, template_data)
 
                 self.submitBtn.setEnabled(True)
@@ -649,74 +865,90 @@ class ParserInterface(BaseInterface):
             else:
                 createWarningInfoBar(self, "Parse Failed", "No data could be extracted")
 
+        except asyncio.CancelledError:
+            cancelled = True
+            logger.info("Parse cancelled")
         except Exception as e:
             logger.error(f"Parse error: {e}")
             raise
         finally:
-            self.parseBtn.setEnabled(True)
+            if self._parse_task is task:
+                self._parse_task = None
+            # Whoever cancelled the parse owns the button state
+            if not cancelled:
+                self.parseBtn.setEnabled(True)
+
+    def _cancelParse(self):
+        """Cancel a parse still in progress; its result is discarded"""
+        if self._parse_task is not None and not self._parse_task.done():
+            self._parse_task.cancel()
+        self._parse_task = None
 
-    @asyncSlot()
-    async def onPatternChanged(self, row: int, new_pattern: str):
-        """Handle pattern change - re-parse with new pattern"""
+    def onPatternChanged(self, row: int, new_pattern: str):
+        """Handle pattern change - queue the row and re-parse once edits settle"""
         if not self.current_file_path or not new_pattern:
             return
 
-        try:
-            # Get field name from row
-            name_item = self.resultsTable.item(row, 0)
-            if not name_item:
-                return
-
-            field_name = name_item.data(Qt.ItemDataRole.UserRole) or name_item.text()
-
-            # Re-parse just this field
-            import pdfplumber
-            full_text = ""
+        self._pending_patterns[row] = new_pattern
+        self._patternTimer.start(self.PATTERN_DEBOUNCE_MS)
 
-            if self.current_file_path.lower().endswith('.pdf'):
-                with pdfplumber.open(self.current_file_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            full_text += page_text + "\n"
-
-            # Apply new pattern
-            try:
-                match = re.search(new_pattern, full_text, re.MULTILINE | re.DOTALL)
-                if match:
-                    value = match.group(1) if match.groups() else match.group(0)
-                    value = value.strip()
+    @asyncSlot()
+    async def _flushPatternChanges(self):
+        """Re-parse every queued row against the cached document text"""
+        pending, self._pending_patterns = self._pending_patterns, {}
+        if not pending or not self.current_file_path:
+            return
 
-                    # Update value in table
-                    self.resultsTable.item(row, 2).setText(str(value))
+        generation = self._rows_generation
+        try:
+            full_text = await self.getFullText()
+            if generation != self._rows_generation:
+                return  # the rows or the file were replaced while the text was read
 
-                    # Update comment
-                    self.resultsTable.item(row, 3).setText("Pattern updated")
-                else:
-                    self.resultsTable.item(row, 2).setText("")
-                    self.resultsTable.item(row, 3).setText("No match found")
+            for row, new_pattern in pending.items():
+                # Apply new pattern
+                try:
+                    match = self.resultsTable.searchPattern(row, new_pattern, full_text)
+                    if match:
+                        # Update value and comment in table
+                        self.resultsTable.setResult(row, "Pattern updated", match_value(match))
+                    else:
+                        self.resultsTable.setResult(row, "No match found", "")
 
-            except re.error as e:
-                self.resultsTable.item(row, 3).setText(f"Pattern error: {str(e)}")
+                except re.error as e:
+                    self.resultsTable.setResult(row, f"Pattern error: {str(e)}")
 
         except Exception as e:
             logger.error(f"Error applying pattern: {e}")
 
+    def _dropPendingPatterns(self):
+        """Forget queued and running pattern edits that refer to rows about to be replaced"""
+        self._patternTimer.stop()
+        self._pending_patterns.clear()
+        self._rows_generation += 1
+
+    async def getFullText(self) -> str:
+        """Text of the current PDF, read in a worker thread on first use and kept until the file changes"""
+        if self._full_text is None:
+            file_path = self.current_file_path
+            if file_path and file_path.lower().endswith('.pdf'):
+                # A cache miss extracts the whole document, which must not block the UI thread
+                text = await asyncio.to_thread(self.parser_service.text_cache.get_text, file_path)
+            else:
+                text = ""
+            if file_path != self.current_file_path:
+                return text  # another file was selected meanwhile; its text is read on its own
+            self._full_text = text
+        return self._full_text
+
     def onRowDeleted(self, row: int):
         """Handle row deletion"""
         logger.info(f"Row {row} deleted")
 
     def onAddRow(self):
         """Add a new row to the results table"""
-        # Get available fields not already in table
-        all_fields = self.parser_service.get_available_fields()
-
         # Get current fields in table
-        current_fields = set()
-        for row in range(self.resultsTable.rowCount()):
-            name_item = self.resultsTable.item(row, 0)
-            if name_item:
-                current_fields.add(name_item.text())
+        current_fields = self.resultsTable.fieldDescs()
 
         # Filter available fields
         available = [(k, v['d_desc']) for k, v in self.parser_service.column_map_cache.items()
@@ -728,7 +960,7 @@ class ParserInterface(BaseInterface):
 
         # Show dialog
         dialog = AddFieldDialog(available, self)
-        if dialog.exec():
+        if dialog.exec() == QDialog.DialogCode.Accepted:
             field_name, field_desc = dialog.getSelectedField()
             self.resultsTable.addNewRow(field_name, field_desc)
 
@@ -760,7 +992,7 @@ class ParserInterface(BaseInterface):
 
         # Show header dialog
         dialog = HeaderDialog(self)
-        if dialog.exec():
+        if dialog.exec() == QDialog.DialogCode.Accepted:
             header_data = dialog.getValues()
 
             # Prepare submission package
@@ -782,12 +1014,14 @@ class ParserInterface(BaseInterface):
 
     def onClear(self):
         """Clear all data"""
+        self._cancelParse()
         self.current_file_path = None
+        self._full_text = None
+        self._dropPendingPatterns()
         self.current_template = None
         self.parse_results = {}
         self.currentFileLabel.setText("No file selected")
-        self.resultsTable.clear()
-        self.resultsTable.setRowCount(0)
+        self.resultsTable.clearResults()
         self.parseBtn.setEnabled(False)
         self.submitBtn.setEnabled(False)
 
@@ -801,76 +1035,69 @@ class ParserInterface(BaseInterface):
     @raise_error_bar_in_class
     async def onBatchProcess(self):
         """Process all files in folder with Hi-Trust UR template"""
-        folder_path = self.folderPathEdit.text()
-        if not folder_path or not os.path.exists(folder_path):
+        folder_path = self.folderPathEdit.text().strip()
+        if not folder_path:
             createWarningInfoBar(self, "Invalid Path", "Please enter a valid folder path")
             return
 
+        # Submissions waiting to be sent to MR Update in one signal
+        submissions: List[dict] = []
+
         try:
             self.batchProcessBtn.setEnabled(False)
+            # Read the template afresh once per batch, so edits saved since the last run apply
+            self.parser_service.clear_template_cache()
 
-            # Get all supported files in folder
-            files = []
-            for ext in ['*.pdf', '*.xlsx', '*.xls']:
-                files.extend(Path(folder_path).glob(ext))
+            # Check the folder and list its supported files in one call off the event loop thread
+            files = await asyncio.to_thread(list_supported_files, folder_path)
+
+            if files is None:
+                createWarningInfoBar(self, "Invalid Path", "Please enter a valid folder path")
+                return
 
             if not files:
                 createWarningInfoBar(self, "No Files", "No supported files found in folder")
                 return
 
-            # Process each file
-            success_count = 0
-            failed_files = []
+            self.batchProgressBar.setMaximum(len(files))
+            self.batchProgressBar.setValue(0)
+            self.batchProgressBar.setVisible(True)
 
-            for file_path in files:
-                try:
-                    results = await self.parser_service.parse_file(
-                        str(file_path),
-                        'Hi-Trust UR'
-                    )
-
-                    if results:
-                        # Extract header info from filename if possible
-                        # Format: {Asset_ID}_{Client_ID}_{Ex_Date}_{ACT/EST}
-                        filename = file_path.stem
-                        parts = filename.split('_')
-
-                        header_data = {
-                            'asset_id': parts[0] if len(parts) > 0 else '',
-                            'client_id': parts[1] if len(parts) > 1 else '',
-                            'type': 'Last Actual'  # Hi-Trust UR uses ACT type
-                        }
-
-                        # Try to parse date from filename
-                        if len(parts) > 2:
-                            try:
-                                ex_date = datetime.strptime(parts[2], '%d%b%Y').date()
-                                header_data['ex_date'] = ex_date
-                            except:
-                                pass
-
-                        # Auto-submit to MR Update
-                        submission_data = {
-                            'header': header_data,
-                            'data': {k: v['value'] for k, v in results.items() if v['value']},
-                            'source_file': str(file_path),
-                            'template': 'Hi-Trust UR',
-                            'timestamp': datetime.now()
-                        }
-
-                        signalBus.mrUpdateSignal.emit('add', submission_data)
-                        success_count += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to process {file_path}: {e}")
-                    failed_files.append(str(file_path.name))
+            # Extract PDF text across worker processes first; each parse below then reads it from the cache
+            await self.parser_service.text_cache.warm_many(
+                [file_path for file_path in files if file_path.suffix.lower() == '.pdf']
+            )
+
+            # Parse files concurrently and handle each one in the order they finish,
+            # so the fastest files reach MR Update first
+            semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+            success_count = 0
+            failed_files = []  # only the names shown in the summary are kept
+            failed_extra = 0
+
+            # All submissions of a batch share its start time
+            batch_ts = datetime.now()
+            tasks = [self._processBatchFile(file_path, semaphore, submissions, batch_ts) for file_path in files]
+            for future in asyncio.as_completed(tasks):
+                file_path, ok = await future
+                if ok:
+                    success_count += 1
+                elif ok is None:
+                    if len(failed_files) < self.FAILED_FILES_SHOWN:
+                        failed_files.append(file_path.name)
+                    else:
+                        failed_extra += 1
+                self.batchProgressBar.setValue(self.batchProgressBar.value() + 1)
+
+                if len(submissions) >= self.BATCH_EMIT_SIZE:
+                    self._emitSubmissions(submissions)
 
             # Show results
             message = f"Processed {success_count}/{len(files)} files successfully"
             if failed_files:
-                message += f"\n\nFailed files:\n" + "\n".join(failed_files[:5])
-                if len(failed_files) > 5:
-                    message += f"\n... and {len(failed_files) - 5} more"
+                message += f"\n\nFailed files:\n" + "\n".join(failed_files)
+                if failed_extra:
+                    message += f"\n... and {failed_extra} more"
 
             if success_count > 0:
                 createSuccessInfoBar(self, "Batch Complete", message)
@@ -878,7 +1105,64 @@ class ParserInterface(BaseInterface):
                 createErrorInfoBar(self, message, title="Batch Failed")
 
         finally:
+            self._emitSubmissions(submissions)
             self.batchProcessBtn.setEnabled(True)
+            self.batchProgressBar.setVisible(False)
+
+    @staticmethod
+    def _emitSubmissions(submissions: List[dict]):
+        """Send queued submissions to MR Update as one 'add_many' signal"""
+        if submissions:
+            signalBus.mrUpdateSignal.emit('add_many', {'records': list(submissions)})
+            submissions.clear()
+
+    async def parseFileCached(self, file_path: str, template_name: str) -> Dict[str, Dict[str, Any]]:
+        """Parse a file, reusing the previous results while the file and template are unchanged"""
+        stat = await asyncio.to_thread(os.stat, file_path)
+        # The template's patterns are part of the key, so editing a template invalidates its results
+        template_data = await asyncio.to_thread(self.parser_service.get_template_data, template_name)
+        key = (
+            os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+            template_name, tuple(template_data.items())
+        )
+
+        results = self._parse_cache.get(key)
+        if results is not None:
+            self._parse_cache.move_to_end(key)
+            return results
+
+        results = await self.parser_service.parse_file(file_path, template_name)
+        self._parse_cache[key] = results
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return results
+
+    async def _processBatchFile(self, file_path: Path, semaphore: asyncio.Semaphore,
+                                submissions: List[dict], timestamp: datetime) -> Tuple[Path, Optional[bool]]:
+        """
+        Parse one batch file and queue its submission for MR Update
+
+        Returns:
+            The file and its outcome: True if queued, False if nothing was parsed, None if it failed
+        """
+        try:
+            async with semaphore:
+                results = await self.parseFileCached(
+                    str(file_path),
+                    BATCH_TEMPLATE
+                )
+
+            # Auto-submit to MR Update; a file where nothing matched has nothing to submit
+            submission_data = _build_submission(file_path, results, timestamp) if results else None
+            if submission_data is None:
+                return file_path, False
+
+            submissions.append(submission_data)
+            return file_path, True
+
+        except Exception as e:
+            logger.error("Failed to process batch file", path=str(file_path), error=str(e))
+            return file_path, None
 
     def onParseComplete(self, success: bool, data: dict):
         """Handle parse complete signal"""
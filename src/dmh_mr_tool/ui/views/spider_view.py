@@ -2,10 +2,12 @@
 """Spider Interface for fetching and managing announcement data"""
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit
 )
@@ -67,6 +69,19 @@ class DataSourceCard(CardWidget):
 class SpiderInterface(BaseInterface):
     """Spider Interface for data fetching operations"""
 
+    LOG_COLORS = {
+        "INFO": "#d4d4d4",
+        "SUCCESS": "#4ec9b0",
+        "WARNING": "#ce9178",
+        "ERROR": "#f48771"
+    }
+
+    # Oldest log lines are dropped beyond this many
+    LOG_MAX_LINES = 500
+
+    # Status refresh requests within this window collapse into one query
+    REFRESH_DEBOUNCE_MS = 150
+
     def __init__(self, parent=None):
         super().__init__(
             title="Spider",
@@ -75,6 +90,14 @@ class SpiderInterface(BaseInterface):
         )
         self.setObjectName('spiderInterface')
         self.spider_service = None
+        self._logSecond = None  # second of the cached log timestamp
+        self._logStamp = ""
+        self._logBuffer = []  # formatted lines waiting for the next flush
+        self._logFlushPending = False
+        self._fetchTasks: Dict[str, asyncio.Task] = {}  # operation -> fetch in progress, stopped by its Cancel button
+        self._refreshTimer = QTimer(self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.timeout.connect(self._doRefresh)
         self.initUI()
         self.initService()
         self.connectSignalToSlot()
@@ -149,6 +172,8 @@ class SpiderInterface(BaseInterface):
         self.dailyFetchBtn.setIcon(FIF.DOWNLOAD)
         self.dailyFetchBtn.clicked.connect(self.onDailyFetch)
 
+        self.dailyCancelBtn = self.createCancelButton("daily", widget)
+
         # Progress indicator
         self.dailyProgress = ProgressRing(widget)
         self.dailyProgress.setFixedSize(24, 24)
@@ -157,6 +182,7 @@ class SpiderInterface(BaseInterface):
         layout.addWidget(BodyLabel("ASX Daily Data:", widget))
         layout.addWidget(self.dailyComboBox)
         layout.addWidget(self.dailyFetchBtn)
+        layout.addWidget(self.dailyCancelBtn)
         layout.addWidget(self.dailyProgress)
         layout.addStretch()
 
@@ -187,6 +213,8 @@ class SpiderInterface(BaseInterface):
         self.tickerFetchBtn.setIcon(FIF.SEARCH)
         self.tickerFetchBtn.clicked.connect(self.onTickerFetch)
 
+        self.tickerCancelBtn = self.createCancelButton("ticker", widget)
+
         # Progress indicator
         self.tickerProgress = IndeterminateProgressRing(widget)
         self.tickerProgress.setFixedSize(24, 24)
@@ -197,6 +225,7 @@ class SpiderInterface(BaseInterface):
         layout.addWidget(BodyLabel("Year:", widget))
         layout.addWidget(self.yearSpinBox)
         layout.addWidget(self.tickerFetchBtn)
+        layout.addWidget(self.tickerCancelBtn)
         layout.addWidget(self.tickerProgress)
         layout.addStretch()
 
@@ -218,6 +247,8 @@ class SpiderInterface(BaseInterface):
         self.batchUpdateBtn.setIcon(FIF.SYNC)
         self.batchUpdateBtn.clicked.connect(self.onBatchUpdate)
 
+        self.batchCancelBtn = self.createCancelButton("batch", widget)
+
         self.syncUrlBtn = PushButton("Sync PDF URLs", widget)
         self.syncUrlBtn.setIcon(FIF.LINK)
         self.syncUrlBtn.clicked.connect(self.onSyncUrls)
@@ -227,6 +258,7 @@ class SpiderInterface(BaseInterface):
         self.batchProgress.setVisible(False)
 
         controlLayout.addWidget(self.batchUpdateBtn)
+        controlLayout.addWidget(self.batchCancelBtn)
         controlLayout.addWidget(self.syncUrlBtn)
         controlLayout.addWidget(self.batchProgress)
         controlLayout.addStretch()
@@ -242,10 +274,27 @@ class SpiderInterface(BaseInterface):
         self.body_layout.addWidget(widget)
         self.body_layout.addWidget(SeparatorWidget(self))
 
+    def createCancelButton(self, operation: str, parent: QWidget) -> PushButton:
+        """Cancel button for an operation, shown only while it runs"""
+        button = PushButton("Cancel", parent)
+        button.setIcon(FIF.CANCEL)
+        button.setVisible(False)
+        button.clicked.connect(lambda: self.cancelFetch(operation))
+        return button
+
+    def cancelFetch(self, operation: str):
+        """Cancel a running fetch; its handler logs the cancellation and restores the controls"""
+        task = self._fetchTasks.get(operation)
+        if task is not None and not task.done():
+            task.cancel()
+
     def addActivityLog(self):
         """Add activity log section"""
         self.logTextEdit = QTextEdit()
         self.logTextEdit.setReadOnly(True)
+        # Bound the log for long sessions; a read-only log needs no undo history
+        self.logTextEdit.setUndoRedoEnabled(False)
+        self.logTextEdit.document().setMaximumBlockCount(self.LOG_MAX_LINES)
         self.logTextEdit.setMaximumHeight(200)
         self.logTextEdit.setStyleSheet("""
             QTextEdit {
@@ -265,7 +314,7 @@ class SpiderInterface(BaseInterface):
 
         clearBtn = PushButton("Clear Log", widget)
         clearBtn.setIcon(FIF.DELETE)
-        clearBtn.clicked.connect(self.logTextEdit.clear)
+        clearBtn.clicked.connect(self.clearLog)
 
         layout.addWidget(self.logTextEdit)
         layout.addWidget(clearBtn, alignment=Qt.AlignmentFlag.AlignRight)
@@ -282,28 +331,58 @@ class SpiderInterface(BaseInterface):
 
     def logActivity(self, message: str, level: str = "INFO"):
         """Log activity to the log widget"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        color_map = {
-            "INFO": "#d4d4d4",
-            "SUCCESS": "#4ec9b0",
-            "WARNING": "#ce9178",
-            "ERROR": "#f48771"
-        }
-        color = color_map.get(level, "#d4d4d4")
+        # Reformat the timestamp only when the wall-clock second changes
+        now = int(time.time())
+        if now != self._logSecond:
+            self._logSecond = now
+            self._logStamp = time.strftime("%H:%M:%S", time.localtime(now))
+        timestamp = self._logStamp
+        color = self.LOG_COLORS.get(level, "#d4d4d4")
 
         html = f'<span style="color: #808080">[{timestamp}]</span> <span style="color: {color}">{message}</span>'
-        self.logTextEdit.append(html)
+        self._logBuffer.append(html)
+
+        # Coalesce bursts of messages into one document update
+        if not self._logFlushPending:
+            self._logFlushPending = True
+            QTimer.singleShot(50, self._flushLog)
+
+    def _flushLog(self):
+        """Append all buffered log lines to the log widget at once"""
+        self._logFlushPending = False
+        if not self._logBuffer:
+            return
+
+        # One edit block per flush, so the document lays out once however many lines arrived;
+        # each line stays its own block
+        document = self.logTextEdit.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for i, html in enumerate(self._logBuffer):
+            if i or not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(html)
+        cursor.endEditBlock()
+        self._logBuffer.clear()
 
         # Auto scroll to bottom
         scrollbar = self.logTextEdit.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def clearLog(self):
+        """Clear the log widget and any lines not yet flushed"""
+        self._logBuffer.clear()
+        self.logTextEdit.clear()
+
     @asyncSlot()
     @raise_error_bar_in_class
     async def onDailyFetch(self):
         """Handle daily data fetch"""
+        task = self._fetchTasks["daily"] = asyncio.current_task()
         try:
             self.dailyFetchBtn.setEnabled(False)
+            self.dailyCancelBtn.setVisible(True)
             self.dailyProgress.setVisible(True)
 
             is_today = self.dailyComboBox.currentIndex() == 0
@@ -330,17 +409,24 @@ class SpiderInterface(BaseInterface):
             # Refresh status
             self.refreshDataSourceStatus()
 
+        except asyncio.CancelledError:
+            self.logActivity("Daily fetch cancelled", "WARNING")
+            raise
         except Exception as e:
             self.logActivity(f"Error fetching daily data: {str(e)}", "ERROR")
             raise
         finally:
+            if self._fetchTasks.get("daily") is task:
+                del self._fetchTasks["daily"]
             self.dailyFetchBtn.setEnabled(True)
+            self.dailyCancelBtn.setVisible(False)
             self.dailyProgress.setVisible(False)
 
     @asyncSlot()
     @raise_error_bar_in_class
     async def onTickerFetch(self):
         """Handle specific ticker fetch"""
+        task = self._fetchTasks["ticker"] = asyncio.current_task()
         try:
             asx_code = self.asxCodeEdit.text().strip().upper()
             year = str(self.yearSpinBox.value())
@@ -350,6 +436,7 @@ class SpiderInterface(BaseInterface):
                 return
 
             self.tickerFetchBtn.setEnabled(False)
+            self.tickerCancelBtn.setVisible(True)
             self.tickerProgress.setVisible(True)
 
             self.logActivity(f"Fetching announcements for {asx_code} in {year}...")
@@ -369,19 +456,27 @@ class SpiderInterface(BaseInterface):
             # Refresh status
             self.refreshDataSourceStatus()
 
+        except asyncio.CancelledError:
+            self.logActivity(f"Ticker fetch for {asx_code} cancelled", "WARNING")
+            raise
         except Exception as e:
             self.logActivity(f"Error fetching ticker data: {str(e)}", "ERROR")
             raise
         finally:
+            if self._fetchTasks.get("ticker") is task:
+                del self._fetchTasks["ticker"]
             self.tickerFetchBtn.setEnabled(True)
+            self.tickerCancelBtn.setVisible(False)
             self.tickerProgress.setVisible(False)
 
     @asyncSlot()
     @raise_error_bar_in_class
     async def onBatchUpdate(self):
         """Handle batch update for all sources"""
+        task = self._fetchTasks["batch"] = asyncio.current_task()
         try:
             self.batchUpdateBtn.setEnabled(False)
+            self.batchCancelBtn.setVisible(True)
             self.batchProgress.setVisible(True)
             self.batchStatusLabel.setText("Running daily spider process...")
 
@@ -408,12 +503,19 @@ class SpiderInterface(BaseInterface):
             # Refresh status
             self.refreshDataSourceStatus()
 
+        except asyncio.CancelledError:
+            self.batchStatusLabel.setText("Daily spider process cancelled")
+            self.logActivity("Daily spider process cancelled", "WARNING")
+            raise
         except Exception as e:
             self.batchStatusLabel.setText("Daily spider process failed")
             self.logActivity(f"Error in batch update: {str(e)}", "ERROR")
             raise
         finally:
+            if self._fetchTasks.get("batch") is task:
+                del self._fetchTasks["batch"]
             self.batchUpdateBtn.setEnabled(True)
+            self.batchCancelBtn.setVisible(False)
             self.batchProgress.setVisible(False)
 
     @asyncSlot()
@@ -444,10 +546,15 @@ class SpiderInterface(BaseInterface):
             self.batchProgress.setVisible(False)
 
     def refreshDataSourceStatus(self):
-        """Refresh data source status cards"""
+        """Refresh data source status cards once requests settle"""
+        self._refreshTimer.start(self.REFRESH_DEBOUNCE_MS)
+
+    @asyncSlot()
+    async def _doRefresh(self):
+        """Query data source status off the GUI thread and update the cards"""
         try:
             # Get status from service
-            status = self.spider_service.get_data_source_status()
+            status = await asyncio.to_thread(self.spider_service.get_data_source_status)
 
             # Update cards
             self.asxCard.updateStatus(status["asx"]["last_update"], status["asx"]["count"])
@@ -0,0 +1,77 @@
+# tests/conftest.py
+"""Shared test setup: a throwaway configuration and an offscreen Qt platform"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+TEMPLATE_PATH = Path(__file__).resolve().parents[1] / "shared" / "configs" / "config.ini"
+
+# Environment variable the application reads its config path from (config.settings.CONFIG_PATH_ENV);
+# spelled out because the settings module loads the config as soon as it is imported
+CONFIG_PATH_ENV = "DMH_MR_TOOL_CONFIG"
+
+_saved_environ = {}
+_test_root = None
+
+
+def _write_test_config(root: Path) -> Path:
+    """Write a testing config whose paths live under root and return its path"""
+    for name in ("db", "db_backups", "downloads", "backups", "logs", "temp"):
+        (root / name).mkdir()
+    (root / "db" / "dmh_tool.db").touch()
+
+    replacements = {
+        "test_path": root / "db" / "dmh_tool.db",
+        "test_download_path": root / "downloads",
+        "test_log_path": root / "logs" / "app.log",
+        "test_temp_path": root / "temp",
+    }
+    lines = []
+    section = None
+    for line in TEMPLATE_PATH.read_text().splitlines():
+        stripped = line.strip()
+        if stripped.startswith("["):
+            section = stripped.strip("[]")
+        key = stripped.split("=", 1)[0].strip() if "=" in stripped else None
+        if key == "environment":
+            line = "environment = testing"
+        elif key == "test_backup_path":
+            line = f"test_backup_path = {root / ('db_backups' if section == 'database' else 'backups')}"
+        elif key in replacements:
+            line = f"{key} = {replacements[key]}"
+        lines.append(line)
+
+    config_path = root / "config.ini"
+    config_path.write_text("\n".join(lines))
+    return config_path
+
+
+def _set_environ(name: str, value: str):
+    _saved_environ.setdefault(name, os.environ.get(name))
+    os.environ[name] = value
+
+
+def pytest_configure(config):
+    """
+    Point the application at a testing config before any test module imports it
+
+    The application loads its configuration on import, so this runs ahead of
+    collection rather than as a fixture.
+    """
+    global _test_root
+    _test_root = Path(tempfile.mkdtemp(prefix="dmh_mr_tool_tests_"))
+    _set_environ(CONFIG_PATH_ENV, str(_write_test_config(_test_root)))
+    _set_environ("QT_QPA_PLATFORM", os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+
+
+def pytest_unconfigure(config):
+    for name, value in _saved_environ.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    _saved_environ.clear()
+    if _test_root is not None:
+        shutil.rmtree(_test_root, ignore_errors=True)
@@ -0,0 +1,173 @@
+# tests/unit/test_mr_update_view.py
+"""Tests for editing, status updates and record keys in the MR Update table"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from PySide6.QtCore import Qt
+
+from ui.views.mr_update_view import MRRecord, MRUpdateTable, MrUpdateInterface
+
+RATE_COL = MRUpdateTable.FIELD_BY_COL.index('mr_income_rate')
+FUND_COL = MRUpdateTable.FIELD_BY_COL.index('fund')
+EX_DATE_COL = MRUpdateTable.FIELD_BY_COL.index('ex_date')
+
+
+def make_record(asset_id: str, rate: float = 0.12345678) -> MRRecord:
+    return MRRecord(
+        client_id="C1",
+        asx_code="ABC",
+        fund="Example Fund",
+        asset_id=asset_id,
+        ex_date=date(2025, 6, 30),
+        pay_date=date(2025, 7, 15),
+        mr_income_rate=rate,
+        type="Last Actual",
+    )
+
+
+@pytest.fixture
+def table(qtbot):
+    table = MRUpdateTable()
+    qtbot.addWidget(table)
+    table.addRecords([make_record("A1"), make_record("A2")])
+    return table
+
+
+def edit_cell(table, row: int, col: int, text: str):
+    """Change a cell the way an editor commit does, then let queued write-backs run"""
+    table.item(row, col).setText(text)
+    table.applyPendingEdits()
+
+
+@pytest.mark.parametrize("status", ["Submitting...", "Success", "Failed: timeout"])
+def test_status_update_leaves_record_and_key_unchanged(table, qtbot, status):
+    record = table.records[0]
+    key = record.get_key()
+
+    table.updateStatus(0, status)
+    qtbot.wait(10)  # let any queued write-back run
+    table.applyPendingEdits()
+
+    assert record.mr_income_rate == 0.12345678
+    assert record.status == status
+    assert table.item(0, 10).text() == status
+    assert table.findRecord(key) == 0
+
+
+def test_success_locks_the_row(table):
+    table.updateStatus(0, "Success")
+
+    assert not table.item(0, RATE_COL).flags() & Qt.ItemFlag.ItemIsEditable
+    assert table.item(1, RATE_COL).flags() & Qt.ItemFlag.ItemIsEditable
+
+
+def test_edit_writes_back_only_the_changed_cell(table):
+    edit_cell(table, 0, FUND_COL, "Renamed Fund")
+
+    record = table.records[0]
+    assert record.fund == "Renamed Fund"
+    # The rate is shown rounded; an untouched rate cell must not round the record
+    assert record.mr_income_rate == 0.12345678
+
+
+def test_edit_of_key_field_moves_the_key(table):
+    old_key = table.records[1].get_key()
+    edit_cell(table, 1, RATE_COL, "0.5")
+
+    record = table.records[1]
+    assert record.mr_income_rate == 0.5
+    assert table.findRecord(old_key) == -1
+    assert table.findRecord(record.get_key()) == 1
+
+
+def test_invalid_edit_reverts_the_row(table):
+    key = table.records[0].get_key()
+    edit_cell(table, 0, EX_DATE_COL, "30/06/2025")
+
+    assert table.records[0].ex_date == date(2025, 6, 30)
+    assert table.item(0, EX_DATE_COL).text() == "2025-06-30"
+    assert table.findRecord(key) == 0
+
+
+def test_adding_a_known_record_updates_its_row(table):
+    updated = make_record("A2")
+    updated.fund = "Updated Fund"
+    table.addRecords([updated])
+
+    assert table.rowCount() == 2
+    assert table.records[1] is updated
+    assert table.item(1, FUND_COL).text() == "Updated Fund"
+
+
+def test_failed_row_update_unblocks_signals(table):
+    broken = make_record("A1")
+    broken.ex_date = None
+
+    with pytest.raises(AttributeError):
+        table.updateRow(0, broken)
+    assert not table.signalsBlocked()
+
+
+def test_delete_reindexes_keys(table):
+    key = table.records[1].get_key()
+    table.deleteRows([0])
+
+    assert table.rowCount() == 1
+    assert table.findRecord(key) == 0
+
+
+def test_record_status_follows_its_row_after_deletes(table):
+    table.addRecords([make_record("A3")])
+    record = table.records[2]
+    table.deleteRows([0])
+
+    table.updateRecordStatus(record, "Failed: rejected")
+    assert table.rowOf(record) == 1
+    assert table.item(1, 10).text() == "Failed: rejected"
+    assert table.item(0, 10).text() == "Pending"
+
+
+def test_record_status_of_deleted_record_touches_no_row(table):
+    record = table.records[0]
+    table.deleteRows([0])
+
+    table.updateRecordStatus(record, "Success")
+    assert table.rowOf(record) == -1
+    assert record.status == "Success"
+    assert table.item(0, 10).text() == "Pending"
+
+
+class GatedDMH:
+    """DMH client whose submissions complete only once released"""
+
+    def __init__(self, result: dict):
+        self.result = result
+        self.release = asyncio.Event()
+
+    async def submit_mr_data(self, record):
+        await self.release.wait()
+        return self.result
+
+
+async def test_submit_reports_on_the_submitted_record_after_a_delete(qtbot):
+    view = MrUpdateInterface()
+    qtbot.addWidget(view)
+    table = view.recordsTable
+    table.addRecords([make_record("A1"), make_record("A2"), make_record("A3")])
+    target = table.records[1]
+    view.dmh_service = GatedDMH({'success': False, 'error': 'rejected'})
+
+    submission = asyncio.ensure_future(view._submitRecord(target))
+    await asyncio.sleep(0)
+    assert table.item(1, 10).text() == "Submitting..."
+
+    # A row above is deleted while the submission is awaited
+    table.deleteRows([0])
+    view.dmh_service.release.set()
+
+    assert await submission is False
+    assert table.records[0] is target
+    assert table.item(0, 10).text() == "Failed: rejected"
+    assert table.item(1, 10).text() == "Pending"
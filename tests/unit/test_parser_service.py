@@ -0,0 +1,200 @@
+# tests/unit/test_parser_service.py
+"""Tests for template pattern matching in the parser service"""
+
+import asyncio
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from business.services.parser_service import (
+    ParserService, TextCache, compile_pattern, is_supported_file, list_supported_files, match_value,
+    regex_patterns, search_patterns
+)
+from ui.utils.signal_bus import signalBus
+
+NOTICE = (
+    "Example Property Trust\n"
+    "Distribution Notice  Rate: 0.123 cents per unit\n"
+    "Ex Date: 30/06/2025\n"
+    "Payment Date: 15/07/2025\n"
+    "Franked: 45%\n"
+    "Prior period Rate: 0.999\n"
+)
+
+
+def search_each(patterns, text):
+    """Reference result: every pattern searched on its own with re"""
+    values = {}
+    for field_name, pattern in patterns.items():
+        match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        if match:
+            values[field_name] = match.group(1 if match.re.groups else 0).strip()
+    return values
+
+
+@pytest.mark.parametrize("patterns", [
+    # A field whose match spans another field's first match
+    {
+        "notice": r"Distribution Notice.*?cents",
+        "income_rate": r"Rate:\s*([\d.]+)",
+    },
+    # Two fields whose first matches start at the same position
+    {
+        "ex_line": r"Ex Date: .*?$",
+        "ex_date": r"Ex Date: (\d{2}/\d{2}/\d{4})",
+    },
+    # Greedy DOTALL pattern covering the whole document before the others
+    {
+        "body": r"Trust(.*)",
+        "pay_date": r"Payment Date:\s*(\S+)",
+        "franked_pct": r"Franked:\s*(\d+)%",
+    },
+    # Patterns with and without groups, nested groups and anchors
+    {
+        "title": r"^\w+ Property Trust$",
+        "pay_date": r"Payment Date: ((\d{2})/(\d{2})/\d{4})",
+        "franked_pct": r"(?:Franked): (\d+)",
+        "missing": r"Withholding: (\d+)",
+    },
+    # Python-only syntax that other regex dialects read differently
+    {
+        "franked_pct": r"Franked: (\d{,3})%",
+        "ex_date": r"Ex Date: (?P<day>\d{2})/",
+    },
+])
+def test_search_patterns_matches_per_field_search(patterns):
+    assert search_patterns(patterns, NOTICE) == search_each(patterns, NOTICE)
+
+
+def test_search_patterns_takes_first_match_after_an_overlapping_field():
+    patterns = {"notice": r"Notice.*?Rate: [\d.]+", "income_rate": r"Rate:\s*([\d.]+)"}
+    assert search_patterns(patterns, NOTICE)["income_rate"] == "0.123"
+
+
+def test_search_patterns_keeps_pattern_order_and_skips_misses():
+    patterns = {"pay_date": r"Payment Date: (\S+)", "missing": r"Nope (\d)", "ex_date": r"Ex Date: (\S+)"}
+    assert list(search_patterns(patterns, NOTICE)) == ["pay_date", "ex_date"]
+
+
+def test_search_patterns_skips_invalid_patterns():
+    patterns = {"broken": r"Rate: ([\d.]+", "franked_pct": r"Franked: (\d+)"}
+    assert search_patterns(patterns, NOTICE) == {"franked_pct": "45"}
+
+
+def test_template_patterns_use_unicode_classes():
+    # PDF text often carries non-breaking spaces and non-ASCII digits between labels and values
+    text = "Rate:\u00a00.123\nUnits:\u2003\u0661\u0662"
+    assert compile_pattern(r"Rate:\s(\S+)").search(text).group(1) == "0.123"
+    assert search_patterns({"units": r"Units:\s(\d+)"}, text) == {"units": "\u0661\u0662"}
+
+
+def test_regex_patterns_drops_empty_and_formula_fields():
+    template = {"income_rate": r"Rate: (\S+)", "total": "=A+B", "tax_rate": "", "fund_id": None}
+    assert regex_patterns(template) == {"income_rate": r"Rate: (\S+)"}
+
+
+def test_match_value_uses_first_group_when_present():
+    assert match_value(re.search(r"Rate: ( [\d.]+ )", "Rate:  0.5 ")) == "0.5"
+    assert match_value(re.search(r"Rate: [\d.]+", "Rate: 0.5")) == "Rate: 0.5"
+
+
+def test_list_supported_files_returns_parseable_files_only(tmp_path):
+    for name in ("a.pdf", "b.XLSX", "c.xls", "notes.txt", "d.pdf.bak"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "folder.pdf").mkdir()
+
+    names = sorted(file_path.name for file_path in list_supported_files(str(tmp_path)))
+    assert names == ["a.pdf", "b.XLSX", "c.xls"]
+
+
+def test_list_supported_files_rejects_missing_folders(tmp_path):
+    (tmp_path / "file.pdf").write_text("")
+    assert list_supported_files(str(tmp_path / "missing")) is None
+    assert list_supported_files(str(tmp_path / "file.pdf")) is None
+    assert list_supported_files(str(tmp_path)) is not None
+
+
+def test_is_supported_file():
+    assert is_supported_file("C:/data/Notice.PDF")
+    assert is_supported_file("rates.xlsx")
+    assert not is_supported_file("rates.csv")
+    assert not is_supported_file("pdf")
+
+
+def read_with_pid(file_path) -> str:
+    """Stand-in extractor that records which process read the file"""
+    return f"{os.getpid()}:{Path(file_path).read_text()}"
+
+
+async def test_warm_many_extracts_in_worker_processes(tmp_path):
+    files = []
+    for i in range(3):
+        file_path = tmp_path / f"notice_{i}.pdf"
+        file_path.write_text(f"Rate: 0.{i}")
+        files.append(file_path)
+    cache = TextCache(tmp_path / "text_cache.db", read_with_pid)
+
+    await cache.warm_many(files + [tmp_path / "missing.pdf"])
+
+    assert cache.missing(files) == []
+    for i, file_path in enumerate(files):
+        pid, text = cache.get_text(file_path).split(":", 1)
+        assert text == f"Rate: 0.{i}"
+        assert int(pid) != os.getpid()
+
+
+async def test_warm_many_skips_cached_files(tmp_path):
+    file_path = tmp_path / "notice.pdf"
+    file_path.write_text("Rate: 0.5")
+    cache = TextCache(tmp_path / "text_cache.db", read_with_pid)
+    cached = cache.get_text(file_path)
+
+    await cache.warm_many([file_path])
+    assert cache.get_text(file_path) == cached
+
+
+async def test_batch_parse_folder_bounds_concurrency_and_keeps_folder_order(tmp_path, monkeypatch):
+    service = ParserService()
+    names = [f"notice_{i}.xlsx" for i in range(12)] + ["broken.xlsx"]
+    for name in names:
+        (tmp_path / name).write_text("")
+    running = 0
+    peak = 0
+
+    async def parse_file(file_path, template_name):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if file_path.endswith("broken.xlsx"):
+            raise ValueError("unreadable")
+        return {"income_rate": {"value": 0.5}}
+
+    monkeypatch.setattr(service, "parse_file", parse_file)
+    monkeypatch.setattr(service, "BATCH_CONCURRENCY", 4)
+    progress = []
+
+    def record_progress(*args):
+        progress.append(args)
+
+    signalBus.spiderProgressSignal.connect(record_progress)
+    try:
+        results = await service.batch_parse_folder(str(tmp_path))
+    finally:
+        signalBus.spiderProgressSignal.disconnect(record_progress)
+
+    assert peak == 4
+    assert [result["file"] for result in results] == [
+        str(file_path) for file_path in list_supported_files(str(tmp_path))
+    ]
+    assert [result["success"] for result in results].count(False) == 1
+    assert next(result for result in results if not result["success"])["error"] == "unreadable"
+    assert progress[-1] == ("Batch Parse", len(names), len(names))
+
+
+async def test_batch_parse_folder_rejects_missing_folders(tmp_path):
+    with pytest.raises(ValueError):
+        await ParserService().batch_parse_folder(str(tmp_path / "missing"))
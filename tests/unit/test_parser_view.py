@@ -0,0 +1,179 @@
+# tests/unit/test_parser_view.py
+"""Tests for the parser view's result table and pattern editing"""
+
+import asyncio
+import re
+import threading
+
+import pytest
+
+from ui.views.parser_view import ParseResultsModel, ParserInterface
+
+TEXT = "Fund: Example Trust\nIncome rate: 0.123\nTax rate: 30%\n"
+TEMPLATE = {
+    "income_rate": r"Income rate:\s*([\d.]+)",
+    "tax_rate": r"Tax rate:\s*(\d+)%",
+}
+RESULTS = {
+    "income_rate": {"value": 0.123, "comment": "", "d_desc": "Income Rate"},
+    "tax_rate": {"value": 30.0, "comment": "", "d_desc": "Tax Rate"},
+}
+
+
+@pytest.fixture
+def parser_view(qtbot):
+    view = ParserInterface()
+    qtbot.addWidget(view)
+    view.current_file_path = "document.pdf"
+    view._full_text = TEXT
+    view.resultsTable.loadParseResults(RESULTS, TEMPLATE)
+    return view
+
+
+def edit_pattern(view, row: int, pattern: str):
+    """Edit a row's pattern; tests flush the queued edit themselves rather than wait for the debounce"""
+    model = view.resultsTable.resultsModel
+    model.setData(model.index(row, ParseResultsModel.PATTERN_COL), pattern)
+    view._patternTimer.stop()
+
+
+async def test_edited_pattern_updates_value(parser_view):
+    edit_pattern(parser_view, 0, r"Fund:\s*(\w+)")
+    await parser_view._flushPatternChanges()
+
+    row = parser_view.resultsTable.resultsModel.row(0)
+    assert row.field_name == "income_rate"
+    assert row.value == "Example"
+    assert row.comment == "Pattern updated"
+
+
+async def test_edited_pattern_without_match_clears_value(parser_view):
+    edit_pattern(parser_view, 1, r"Withholding:\s*(\d+)")
+    await parser_view._flushPatternChanges()
+
+    row = parser_view.resultsTable.resultsModel.row(1)
+    assert row.value == ""
+    assert row.comment == "No match found"
+
+
+def test_search_pattern_finds_first_match_after_refining(parser_view):
+    table = parser_view.resultsTable
+    text = "Rate: 0.1\n" + "." * 1000 + "\nPrior Rate: 0.9\n"
+
+    assert table.searchPattern(0, r"Prior Rate: ([\d.]+)", text).group(1) == "0.9"
+    # The refined pattern also matches right by the previous hit, but its first match is earlier
+    assert table.searchPattern(0, r"Rate: ([\d.]+)", text).group(1) == "0.1"
+
+
+def test_search_pattern_matches_whole_text_search(parser_view):
+    table = parser_view.resultsTable
+    text = "Header\nNotes: " + "x" * 600 + "\nEnd\n"
+
+    table.searchPattern(0, r"Notes: (x{10})", text)
+    for pattern in (r"Notes: (.*)", r"Notes: (x+)$", r"(x{500,})"):
+        expected = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        assert table.searchPattern(0, pattern, text).span(1) == expected.span(1)
+
+
+
+class StubTextCache:
+    """Text cache that records the thread reading it and can hold the read until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.threads = []
+
+    def get_text(self, file_path):
+        self.threads.append(threading.get_ident())
+        self.release.wait(5)
+        return TEXT
+
+
+@pytest.fixture
+def text_cache(parser_view, monkeypatch):
+    cache = StubTextCache()
+    monkeypatch.setattr(parser_view.parser_service, "text_cache", cache)
+    parser_view._full_text = None
+    return cache
+
+
+async def test_pattern_edit_reads_text_off_the_gui_thread(parser_view, text_cache):
+    edit_pattern(parser_view, 0, r"Fund:\s*(\w+)")
+    await parser_view._flushPatternChanges()
+
+    assert text_cache.threads and threading.get_ident() not in text_cache.threads
+    assert parser_view.resultsTable.resultsModel.row(0).value == "Example"
+
+
+async def test_pattern_edit_result_is_dropped_when_rows_are_replaced(parser_view, text_cache):
+    text_cache.release.clear()
+    edit_pattern(parser_view, 0, r"Fund:\s*(\w+)")
+    flush = parser_view._flushPatternChanges()
+    while not text_cache.threads:
+        await asyncio.sleep(0.01)
+
+    # The parse results are reloaded while the document text is still being read
+    parser_view._dropPendingPatterns()
+    parser_view.resultsTable.loadParseResults(RESULTS, TEMPLATE)
+    text_cache.release.set()
+    await flush
+
+    row = parser_view.resultsTable.resultsModel.row(0)
+    assert row.value == "0.123"
+    assert row.comment == ""
+
+async def test_invalid_pattern_is_reported_on_its_row(parser_view):
+    edit_pattern(parser_view, 1, r"Tax rate:\s*(\d+")
+    await parser_view._flushPatternChanges()
+
+    row = parser_view.resultsTable.resultsModel.row(1)
+    assert row.value == "30.0"
+    assert row.comment.startswith("Pattern error")
+
+
+@pytest.fixture
+def template_store(parser_view, tmp_path, monkeypatch):
+    """Templates served from a dict standing in for the database, and a stub parse counting its calls"""
+    service = parser_view.parser_service
+    templates = {"edited": dict(TEMPLATE)}
+    parses = []
+
+    async def parse_file(file_path, template_name):
+        parses.append(service.get_template_data(template_name))
+        return RESULTS
+
+    monkeypatch.setattr(service, "_load_template_data", lambda name: dict(templates.get(name, {})))
+    monkeypatch.setattr(service, "parse_file", parse_file)
+    service.clear_template_cache()
+
+    file_path = tmp_path / "notice.pdf"
+    file_path.write_text("")
+    parser_view.current_file_path = str(file_path)
+    parser_view.templateCombo.addItem("edited")
+    parser_view.templateCombo.setCurrentText("edited")
+    yield templates, parses
+    service.clear_template_cache()
+
+
+async def test_parse_uses_template_edited_since_last_parse(parser_view, template_store):
+    templates, _ = template_store
+
+    await parser_view.onParse()
+    templates["edited"]["tax_rate"] = r"Tax:\s*(\d+)%"
+    await parser_view.onParse()
+
+    assert parser_view.resultsTable.resultsModel.row(1).pattern == r"Tax:\s*(\d+)%"
+
+
+async def test_unchanged_file_is_reparsed_after_template_edit(parser_view, template_store):
+    templates, parses = template_store
+
+    await parser_view.onParse()
+    await parser_view.onParse()
+    assert len(parses) == 1
+
+    templates["edited"]["tax_rate"] = r"Tax:\s*(\d+)%"
+    await parser_view.onParse()
+    assert len(parses) == 2
+    assert parses[-1]["tax_rate"] == r"Tax:\s*(\d+)%"
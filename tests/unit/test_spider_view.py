@@ -0,0 +1,49 @@
+# tests/unit/test_spider_view.py
+"""Tests for cancelling fetches from the Spider view"""
+
+import asyncio
+
+import pytest
+
+from ui.views.spider_view import SpiderInterface
+
+
+class StalledSpider:
+    """Spider service whose fetches never finish on their own"""
+
+    async def fetch_daily_announcements(self, is_today):
+        await asyncio.Event().wait()
+
+    async def crawl_asx_info(self, asx_codes, year):
+        await asyncio.Event().wait()
+
+    async def run_daily_spider(self):
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def spider_view(qtbot):
+    view = SpiderInterface()
+    qtbot.addWidget(view)
+    view.spider_service = StalledSpider()
+    view.asxCodeEdit.setText("ABC")
+    return view
+
+
+@pytest.mark.parametrize("operation, handler, button", [
+    ("daily", "onDailyFetch", "dailyFetchBtn"),
+    ("ticker", "onTickerFetch", "tickerFetchBtn"),
+    ("batch", "onBatchUpdate", "batchUpdateBtn"),
+])
+async def test_cancelled_fetch_ends_cancelled_and_restores_controls(spider_view, operation, handler, button):
+    task = getattr(spider_view, handler)()
+    await asyncio.sleep(0)
+    assert not getattr(spider_view, button).isEnabled()
+
+    spider_view.cancelFetch(operation)
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert task.cancelled()
+    assert operation not in spider_view._fetchTasks
+    assert getattr(spider_view, button).isEnabled()